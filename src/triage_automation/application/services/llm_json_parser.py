@@ -10,6 +10,7 @@ _FENCED_JSON_PATTERN = re.compile(
     r"```(?:json)?\s*(\{[\s\S]*\})\s*```",
     flags=re.IGNORECASE,
 )
+_JSON_DECODER = json.JSONDecoder()
 
 
 class LlmJsonParseError(ValueError):
@@ -62,15 +63,14 @@ def _extract_fenced_json(raw_response: str) -> str | None:
 
 
 def _extract_first_embedded_json_object(raw_response: str) -> dict[str, object] | None:
-    decoder = json.JSONDecoder()
-    for index, value in enumerate(raw_response):
-        if value != "{":
-            continue
-        fragment = raw_response[index:]
+    index = raw_response.find("{")
+    while index != -1:
         try:
-            decoded, _ = decoder.raw_decode(fragment)
+            decoded, _ = _JSON_DECODER.raw_decode(raw_response, index)
         except json.JSONDecodeError:
-            continue
-        if isinstance(decoded, dict):
-            return cast("dict[str, object]", decoded)
+            pass
+        else:
+            if isinstance(decoded, dict):
+                return cast("dict[str, object]", decoded)
+        index = raw_response.find("{", index + 1)
     return None
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Protocol
@@ -108,6 +109,7 @@ class PostRoom2WidgetService:
         message_repository: MessageRepositoryPort,
         prior_case_queries: PriorCaseQueryPort,
         matrix_poster: MatrixRoomPosterPort,
+        now: Callable[[], datetime] | None = None,
     ) -> None:
         self._room2_id = room2_id
         self._widget_public_base_url = widget_public_base_url.rstrip("/")
@@ -116,6 +118,7 @@ class PostRoom2WidgetService:
         self._message_repository = message_repository
         self._prior_case_queries = prior_case_queries
         self._matrix_poster = matrix_poster
+        self._now = now or (lambda: datetime.now(tz=UTC))
 
     async def post_widget(self, *, case_id: UUID) -> dict[str, object]:
         """Post Room-2 root message plus doctor-facing review/reply context messages."""
@@ -172,7 +175,7 @@ class PostRoom2WidgetService:
         prior_context = await self._prior_case_queries.lookup_recent_context(
             case_id=case_id,
             agency_record_number=case.agency_record_number,
-            now=datetime.now(tz=UTC),
+            now=self._now(),
         )
         logger.info(
             "room2_widget_prior_lookup case_id=%s prior_case_found=%s prior_denial_count_7d=%s",
@@ -482,9 +485,10 @@ def _build_widget_payload(
 
     structured_data = case.structured_data_json
     suggested_action_json = case.suggested_action_json
+    case_id_value = str(case.case_id)
 
     payload: dict[str, object] = {
-        "case_id": str(case.case_id),
+        "case_id": case_id_value,
         "agency_record_number": case.agency_record_number,
         "structured_data": structured_data,
         "summary": case.summary_text,
@@ -492,7 +496,7 @@ def _build_widget_payload(
             "suggestion": _extract_suggestion(suggested_action_json),
         },
         "widget_launch": {
-            "case_id": str(case.case_id),
+            "case_id": case_id_value,
             "url": _build_widget_launch_url(
                 widget_public_base_url=widget_public_base_url,
                 case_id=case.case_id,
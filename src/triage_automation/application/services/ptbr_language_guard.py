@@ -6,7 +6,7 @@ import re
 from collections.abc import Iterable
 
 _FORBIDDEN_ENGLISH_TERMS_PATTERN = re.compile(
-    r"\b("
+    r"\b(?:"
     r"accept|accepted|deny|denied|support|reason|because|therefore|however|"
     r"patient|summary|recommendation|recommended|required|insufficient|"
     r"unknown|none|dinai|die"
@@ -18,9 +18,10 @@ _FORBIDDEN_ENGLISH_TERMS_PATTERN = re.compile(
 def collect_forbidden_terms(*, texts: Iterable[str]) -> list[str]:
     """Return sorted unique forbidden English tokens found across narrative texts."""
 
-    found: set[str] = set()
-    for text in texts:
-        for match in _FORBIDDEN_ENGLISH_TERMS_PATTERN.finditer(text):
-            found.add(match.group(0).lower())
+    found = {
+        term.lower()
+        for text in texts
+        for term in _FORBIDDEN_ENGLISH_TERMS_PATTERN.findall(text)
+    }
     return sorted(found)
 
@@ -15,6 +15,8 @@ from triage_automation.application.ports.supervisor_summary_dispatch_repository_
     SupervisorSummaryWindowKey,
 )
 
+_SUMMARY_WINDOW_LENGTH = timedelta(hours=12)
+
 
 @dataclass(frozen=True)
 class SupervisorSummaryWindow:
@@ -149,7 +151,7 @@ def resolve_previous_summary_window(
         raise ValueError("unable to resolve previous summary cutoff")
 
     window_end_local = max(eligible)
-    window_start_local = window_end_local - timedelta(hours=12)
+    window_start_local = window_end_local - _SUMMARY_WINDOW_LENGTH
 
     return SupervisorSummaryWindow(
         window_start_local=window_start_local,
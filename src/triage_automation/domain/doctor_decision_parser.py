@@ -149,11 +149,7 @@ def _normalize_key(raw_key: str) -> str:
 
 
 def _resolve_key(normalized_key: str) -> str | None:
-    for canonical, aliases in _KEY_ALIASES.items():
-        alias_set = {_normalize_token(alias) for alias in aliases}
-        if normalized_key in alias_set:
-            return canonical
-    return None
+    return _NORMALIZED_KEY_ALIASES.get(normalized_key)
 
 
 def _normalized_message_lines(*, body: str) -> list[str]:
@@ -189,3 +185,10 @@ def _normalize_token(value: str) -> str:
 def _strip_diacritics(value: str) -> str:
     decomposed = unicodedata.normalize("NFKD", value)
     return "".join(character for character in decomposed if not unicodedata.combining(character))
+
+
+_NORMALIZED_KEY_ALIASES: dict[str, str] = {
+    _normalize_token(alias): canonical
+    for canonical, aliases in _KEY_ALIASES.items()
+    for alias in aliases
+}
@@ -38,38 +38,33 @@ def _line_context_for_index(text: str, index: int) -> tuple[int, str]:
     return line_number, text[line_start:line_end].strip()
 
 
+def _iter_code_positions(text: str) -> list[tuple[int, str]]:
+    positions = {
+        (pattern_match.start(1), pattern_match.group(1))
+        for pattern in (_CODE_LABEL_PATTERN, _REPORT_HEADER_FLOW_PATTERN)
+        for pattern_match in pattern.finditer(text)
+    }
+    return sorted(positions)
+
+
 def _iter_code_matches(text: str) -> list[PatientRegistrationCodeMatch]:
-    seen: set[tuple[int, str]] = set()
-    ordered: list[tuple[int, PatientRegistrationCodeMatch]] = []
-
-    for pattern in (_CODE_LABEL_PATTERN, _REPORT_HEADER_FLOW_PATTERN):
-        for pattern_match in pattern.finditer(text):
-            code = pattern_match.group(1)
-            code_start = pattern_match.start(1)
-            unique_key = (code_start, code)
-            if unique_key in seen:
-                continue
-            seen.add(unique_key)
-            line_number, line_text = _line_context_for_index(text, code_start)
-            ordered.append(
-                (
-                    code_start,
-                    PatientRegistrationCodeMatch(
-                        code=code,
-                        line_number=line_number,
-                        line_text=line_text,
-                    ),
-                )
+    matches: list[PatientRegistrationCodeMatch] = []
+    for code_start, code in _iter_code_positions(text):
+        line_number, line_text = _line_context_for_index(text, code_start)
+        matches.append(
+            PatientRegistrationCodeMatch(
+                code=code,
+                line_number=line_number,
+                line_text=line_text,
             )
-
-    ordered.sort(key=lambda item: item[0])
-    return [item[1] for item in ordered]
+        )
+    return matches
 
 
 def extract_patient_registration_codes(text: str) -> list[str]:
     """Extract all supported patient registration code occurrences from text."""
 
-    return [match.code for match in _iter_code_matches(text)]
+    return [code for _, code in _iter_code_positions(text)]
 
 
 def extract_patient_registration_matches(text: str) -> list[PatientRegistrationCodeMatch]:
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import re
 import time
-from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from triage_automation.domain.patient_registration_code import extract_patient_registration_codes
 
 _REPEATED_FIVE_DIGIT_LINE_PATTERN = re.compile(r"^\s*(\d{5})(?:\s+\1){3,}\s*$")
 _FIVE_DIGIT_TOKEN_PATTERN = re.compile(r"\b(\d{5})\b")
+_HORIZONTAL_WHITESPACE_PATTERN = re.compile(r"[ \t]+")
 
 
 @dataclass(frozen=True)
@@ -32,7 +33,7 @@ def extract_and_strip_agency_record_number(text: str) -> RecordNumberExtractionR
     explicit_codes = extract_patient_registration_codes(text)
     selected = explicit_codes[0] if explicit_codes else str(_current_epoch_millis())
 
-    cleaned_text = re.sub(rf"\b{re.escape(selected)}\b", " ", text)
+    cleaned_text = _remove_whole_tokens(text, (selected,))
     cleaned_text = _strip_repeated_five_digit_watermarks(
         cleaned_text,
         protected_token=selected,
@@ -56,7 +57,7 @@ def _normalize_preserving_linebreaks(text: str) -> str:
 
     normalized_lines: list[str] = []
     for raw_line in text.splitlines():
-        compact = re.sub(r"[ \t]+", " ", raw_line).strip()
+        compact = _HORIZONTAL_WHITESPACE_PATTERN.sub(" ", raw_line).strip()
         if not compact:
             if normalized_lines and normalized_lines[-1] != "":
                 normalized_lines.append("")
@@ -70,36 +71,38 @@ def _strip_repeated_five_digit_watermarks(text: str, *, protected_token: str) ->
     """Remove repeated 5-digit watermark bands and residual isolated tokens."""
 
     lines = text.splitlines()
-    repeated_line_token_counts: Counter[str] = Counter()
-    for line in lines:
-        match = _REPEATED_FIVE_DIGIT_LINE_PATTERN.match(line)
-        if match is None:
-            continue
-        repeated_line_token_counts[match.group(1)] += 1
+    line_tokens = [_repeated_five_digit_line_token(line) for line in lines]
 
-    candidate_tokens = {
-        token for token, count in repeated_line_token_counts.items() if count >= 1
-    }
+    candidate_tokens = {token for token in line_tokens if token is not None}
     candidate_tokens.discard(protected_token)
     if not candidate_tokens:
         return text
 
-    filtered_lines: list[str] = []
-    for line in lines:
-        match = _REPEATED_FIVE_DIGIT_LINE_PATTERN.match(line)
-        if match is not None and match.group(1) in candidate_tokens:
-            continue
-        filtered_lines.append(line)
-
-    partially_cleaned = "\n".join(filtered_lines)
-    token_counts = Counter(_FIVE_DIGIT_TOKEN_PATTERN.findall(partially_cleaned))
-    removable_tokens = {
-        token for token in candidate_tokens if token_counts.get(token, 0) >= 1
-    }
+    partially_cleaned = "\n".join(
+        line
+        for line, token in zip(lines, line_tokens, strict=True)
+        if token not in candidate_tokens
+    )
+    residual_tokens = set(_FIVE_DIGIT_TOKEN_PATTERN.findall(partially_cleaned))
+    removable_tokens = candidate_tokens & residual_tokens
     if not removable_tokens:
         return partially_cleaned
 
-    result = partially_cleaned
-    for token in removable_tokens:
-        result = re.sub(rf"\b{re.escape(token)}\b", " ", result)
-    return result
+    return _remove_whole_tokens(partially_cleaned, removable_tokens)
+
+
+def _repeated_five_digit_line_token(line: str) -> str | None:
+    """Return the token of a repeated 5-digit watermark band line, if any."""
+
+    match = _REPEATED_FIVE_DIGIT_LINE_PATTERN.match(line)
+    return None if match is None else match.group(1)
+
+
+def _remove_whole_tokens(text: str, tokens: Iterable[str]) -> str:
+    """Replace every whole-word occurrence of any token with a single space."""
+
+    present = sorted((token for token in tokens if token in text), key=len, reverse=True)
+    if not present:
+        return text
+    pattern = r"\b(?:" + "|".join(re.escape(token) for token in present) + r")\b"
+    return re.sub(pattern, " ", text)
@@ -6,10 +6,13 @@ import re
 import unicodedata
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
 _BRT = ZoneInfo("America/Bahia")
+_DASH_DATETIME_FORMAT = "%d-%m-%Y %H:%M"
+_SLASH_DATETIME_FORMAT = "%d/%m/%Y %H:%M"
 _KEY_ALIASES: dict[str, tuple[str, ...]] = {
     "case": ("case", "caso"),
     "status": ("status", "situacao", "situação", "estado"),
@@ -38,6 +41,10 @@ _EMPTY_REASON_MARKERS = {
 _UUID_PATTERN = re.compile(
     r"([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})"
 )
+_WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+_BRT_SUFFIX_PATTERN = re.compile(r"\s*brt\.?\s*$", flags=re.IGNORECASE)
+_KEY_BULLET_PREFIX_PATTERN = re.compile(r"^[>\-–—*•\d\.\)\( ]+")
+_UNDERSCORE_RUN_PATTERN = re.compile(r"_+")
 
 
 @dataclass(frozen=True)
@@ -183,7 +190,7 @@ def _extract_required_value(*, lines: list[str], key: str) -> str:
 
 
 def _extract_value(*, lines: list[str], key: str) -> str | None:
-    aliases = {_normalize_key(alias) for alias in _KEY_ALIASES.get(key, (key,))}
+    aliases = _normalized_key_aliases(key)
     value: str | None = None
     for line_key, line_value in _iter_labeled_values(lines=lines):
         if line_key not in aliases:
@@ -196,6 +203,11 @@ def _extract_value(*, lines: list[str], key: str) -> str | None:
     return value
 
 
+@lru_cache(maxsize=len(_KEY_ALIASES))
+def _normalized_key_aliases(key: str) -> frozenset[str]:
+    return frozenset(_normalize_key(alias) for alias in _KEY_ALIASES.get(key, (key,)))
+
+
 def _iter_labeled_values(*, lines: list[str]) -> list[tuple[str, str]]:
     labeled: list[tuple[str, str]] = []
     for raw_line in lines:
@@ -235,27 +247,26 @@ def _normalize_reason(reason: str | None) -> str | None:
 
 def _parse_brt_datetime(line: str) -> datetime:
     value = line.strip().replace("：", ":")
-    value = re.sub(r"\s+", " ", value).strip("`")
-    value = re.sub(r"\s*brt\.?\s*$", "", value, flags=re.IGNORECASE)
-
-    formats = ("%d-%m-%Y %H:%M", "%d/%m/%Y %H:%M")
-    for date_format in formats:
-        try:
-            naive = datetime.strptime(value, date_format)
-            return naive.replace(tzinfo=_BRT)
-        except ValueError:
-            continue
+    value = _WHITESPACE_RUN_PATTERN.sub(" ", value).strip("`")
+    value = _BRT_SUFFIX_PATTERN.sub("", value)
 
-    raise SchedulerParseError("invalid_confirmed_datetime")
+    # Only the slash format can contain "/", so pick it up front instead of
+    # paying for a failed strptime on every slash-formatted reply.
+    date_format = _SLASH_DATETIME_FORMAT if "/" in value else _DASH_DATETIME_FORMAT
+    try:
+        naive = datetime.strptime(value, date_format)
+    except ValueError as error:
+        raise SchedulerParseError("invalid_confirmed_datetime") from error
+    return naive.replace(tzinfo=_BRT)
 
 
 def _normalize_key(raw_key: str) -> str:
     key = raw_key.strip().lower()
     key = key.strip("`*_ ")
-    key = re.sub(r"^[>\-–—*•\d\.\)\( ]+", "", key)
+    key = _KEY_BULLET_PREFIX_PATTERN.sub("", key)
     key = key.replace("-", "_").replace("/", "_").replace(" ", "_")
     key = _strip_diacritics(key)
-    key = re.sub(r"_+", "_", key)
+    key = _UNDERSCORE_RUN_PATTERN.sub("_", key)
     return key.strip("_")
 
 
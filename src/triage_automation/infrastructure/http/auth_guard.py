@@ -91,6 +91,10 @@ class WidgetAuthGuard:
         )
         token_hash = self._token_service.hash_token(token)
         token_record = await self._auth_token_repository.get_active_by_hash(token_hash=token_hash)
+        if token_record is None:
+            token_record = await self._auth_token_repository.get_active_by_hash(
+                token_hash=self._token_service.hash_token_legacy(token)
+            )
         if token_record is None:
             raise InvalidAuthTokenError("invalid or expired auth token")
 
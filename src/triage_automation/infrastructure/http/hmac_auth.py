@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
-import hashlib
 import hmac
 
 
 def compute_hmac_sha256(*, secret: str, body: bytes) -> str:
     """Return hex HMAC-SHA256 digest for raw request body."""
 
-    digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256)
-    return digest.hexdigest()
+    return hmac.digest(secret.encode("utf-8"), body, "sha256").hex()
 
 
 def verify_hmac_signature(*, secret: str, body: bytes, provided_signature: str | None) -> bool:
@@ -39,6 +39,17 @@ INFORMATIONAL_CASE_ID_TEMPLATE_BUILDERS: tuple[str, ...] = (
 )
 
 
+# Single (PAS) notations first, then paired PA/TA readings; group 1 is systolic.
+_ROOM2_SYSTOLIC_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(r"\bpas\s*[:=]?\s*([0-9]{2,3})\b"),
+    re.compile(r"\bpa\s*[:=]?\s*([0-9]{2,3})\s*[x/]\s*([0-9]{2,3})\b"),
+    re.compile(r"\bta\s*[:=]?\s*([0-9]{2,3})\s*[x/]\s*([0-9]{2,3})\b"),
+)
+
+# Runs of non-alphanumeric characters (underscore included) collapse to one dash.
+_FILENAME_SLUG_SEPARATOR_PATTERN = re.compile(r"[\W_]+")
+
+
 def build_human_identification_block(
     *,
     agency_record_number: str | None,
@@ -109,6 +120,29 @@ _PT_BR_KEY_MAP: dict[str, str] = {
     "urgency": "urgencia",
 }
 
+_DECISION_LABELS: dict[str, str] = {
+    "accept": "aceitar",
+    "deny": "negar",
+}
+
+_SUPPORT_LABELS: dict[str, str] = {
+    "none": "nenhum",
+    "anesthesist": "anestesista",
+    "anesthesist_icu": "anestesista_uti",
+}
+
+_PRESENTATION_VALUE_MAP: dict[str, str] = {
+    **_DECISION_LABELS,
+    **_SUPPORT_LABELS,
+    "yes": "sim",
+    "no": "nao",
+    "unknown": "desconhecido",
+    "bleeding": "sangramento",
+    "moderate": "moderado",
+    "low": "baixo",
+    "high": "alto",
+}
+
 
 def _normalize_human_identification_value(value: str | None) -> str:
     normalized = (value or "").strip()
@@ -155,7 +189,7 @@ def build_room2_widget_message(
 ) -> str:
     """Build Room-2 widget post body with embedded JSON payload."""
 
-    payload_json = json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
+    payload_json = json.dumps(payload, ensure_ascii=False, indent=2)
     identification_block = build_human_identification_block(
         agency_record_number=agency_record_number,
         patient_name=patient_name,
@@ -605,20 +639,8 @@ def _extract_room2_systolic_values(text: str) -> list[int]:
     """Extract systolic blood-pressure values from common textual notations."""
 
     values: list[int] = []
-    single_patterns = (
-        r"\bpas\s*[:=]?\s*([0-9]{2,3})\b",
-    )
-    paired_patterns = (
-        r"\bpa\s*[:=]?\s*([0-9]{2,3})\s*[x/]\s*([0-9]{2,3})\b",
-        r"\bta\s*[:=]?\s*([0-9]{2,3})\s*[x/]\s*([0-9]{2,3})\b",
-    )
-
-    for pattern in single_patterns:
-        for match in re.finditer(pattern, text):
-            values.append(int(match.group(1)))
-
-    for pattern in paired_patterns:
-        for match in re.finditer(pattern, text):
+    for pattern in _ROOM2_SYSTOLIC_PATTERNS:
+        for match in pattern.finditer(text):
             values.append(int(match.group(1)))
 
     return values
@@ -997,16 +1019,17 @@ def build_room2_decision_error_message(*, case_id: UUID, error_code: str) -> str
     """Build deterministic Room-2 decision error feedback with correction guidance."""
 
     guidance = _room2_decision_error_guidance(error_code=error_code)
+    case_value = str(case_id)
     return (
         "resultado: erro\n"
-        f"caso: {case_id}\n"
+        f"caso: {case_value}\n"
         f"codigo_erro: {error_code}\n"
         f"acao: {guidance}\n\n"
         "Modelo obrigatório:\n"
         "decisao: aceitar|negar\n"
         "suporte: nenhum|anestesista|anestesista_uti\n"
         "motivo: <texto livre ou vazio>\n"
-        f"caso: {case_id}"
+        f"caso: {case_value}"
     )
 
 
@@ -1021,39 +1044,15 @@ def _room2_decision_error_guidance(*, error_code: str) -> str:
 
 
 def _format_decision_value(value: str) -> str:
-    if value == "accept":
-        return "aceitar"
-    if value == "deny":
-        return "negar"
-    return value
+    return _DECISION_LABELS.get(value, value)
 
 
 def _format_support_value(value: str) -> str:
-    if value == "none":
-        return "nenhum"
-    if value == "anesthesist":
-        return "anestesista"
-    if value == "anesthesist_icu":
-        return "anestesista_uti"
-    return value
+    return _SUPPORT_LABELS.get(value, value)
 
 
 def _map_presentation_value(value: str) -> str:
-    mapping = {
-        "accept": "aceitar",
-        "deny": "negar",
-        "none": "nenhum",
-        "anesthesist": "anestesista",
-        "anesthesist_icu": "anestesista_uti",
-        "yes": "sim",
-        "no": "nao",
-        "unknown": "desconhecido",
-        "bleeding": "sangramento",
-        "moderate": "moderado",
-        "low": "baixo",
-        "high": "alto",
-    }
-    return mapping.get(value, value)
+    return _PRESENTATION_VALUE_MAP.get(value, value)
 
 
 def build_room3_request_message(
@@ -1318,15 +1317,7 @@ def _normalize_record_number_for_filename(value: str | None) -> str:
     normalized = (value or "").strip()
     if not normalized:
         return "indisponivel"
-    slug_chars: list[str] = []
-    for char in normalized:
-        if char.isalnum():
-            slug_chars.append(char.lower())
-            continue
-        slug_chars.append("-")
-    slug = "".join(slug_chars).strip("-")
+    slug = _FILENAME_SLUG_SEPARATOR_PATTERN.sub("-", normalized).strip("-").lower()
     if not slug:
         return "indisponivel"
-    while "--" in slug:
-        slug = slug.replace("--", "-")
     return slug
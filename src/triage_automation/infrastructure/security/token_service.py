@@ -8,6 +8,8 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
+TOKEN_HASH_PREFIX = "b2$"
+
 
 @dataclass(frozen=True)
 class IssuedOpaqueToken:
@@ -42,7 +44,28 @@ class OpaqueTokenService:
             expires_at=self._now() + self._token_ttl,
         )
 
-    def hash_token(self, token: str) -> str:
-        """Hash opaque token for database storage."""
+    def hash_token(self, token: str | bytes) -> str:
+        """Hash opaque token for database storage using prefixed BLAKE2b digest."""
+
+        return f"{TOKEN_HASH_PREFIX}{self.hash_token_bytes(token).hex()}"
+
+    def hash_token_bytes(self, token: str | bytes) -> bytes:
+        """Return raw 32-byte BLAKE2b digest backing the persisted token hash."""
+
+        return hashlib.blake2b(_token_bytes(token), digest_size=32).digest()
+
+    def hash_token_legacy(self, token: str | bytes) -> str:
+        """Hash opaque token with the legacy unprefixed SHA-256 scheme.
+
+        Used only to validate tokens persisted before the BLAKE2b switch.
+        """
+
+        return hashlib.sha256(_token_bytes(token)).hexdigest()
+
+
+def _token_bytes(token: str | bytes) -> bytes:
+    """Return UTF-8 token bytes, reusing caller-provided bytes without re-encoding."""
 
-        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+    if isinstance(token, bytes):
+        return token
+    return token.encode("utf-8")
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import shutil
+from collections.abc import AsyncIterator, Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.pool import NullPool
+
+from alembic import command
+from triage_automation.infrastructure.db.session import create_session_factory
+
+_SQLITE_TEST_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _apply_sqlite_test_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_TEST_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def sqlite_test_pragmas() -> Iterator[None]:
+    """Skip journal/fsync disk I/O on every SQLite engine opened during the session.
+
+    Test databases are disposable, so durability is traded for speed. The listener
+    is global so it also covers Alembic's engine and runtime-built engines.
+    locking_mode=EXCLUSIVE is deliberately left out: tests open sync and async
+    connections to the same database file.
+    """
+
+    sa.event.listen(sa.Engine, "connect", _apply_sqlite_test_pragmas)
+    try:
+        yield
+    finally:
+        sa.event.remove(sa.Engine, "connect", _apply_sqlite_test_pragmas)
+
+
+@pytest.fixture(scope="session")
+def migrated_db_template(
+    tmp_path_factory: pytest.TempPathFactory,
+    sqlite_test_pragmas: None,
+) -> Path:
+    """Upgrade one SQLite database to Alembic head for tests to copy per case."""
+
+    template_path = tmp_path_factory.mktemp("alembic_head") / "head.db"
+    alembic_config = Config("alembic.ini")
+    alembic_config.set_main_option("sqlalchemy.url", f"sqlite+pysqlite:///{template_path}")
+    command.upgrade(alembic_config, "head")
+    return template_path
+
+
+@pytest.fixture
+def migrated_db_path(tmp_path: Path, migrated_db_template: Path) -> Path:
+    """Copy the head template into a per-test SQLite database file."""
+
+    db_path = tmp_path / "head.db"
+    shutil.copyfile(migrated_db_template, db_path)
+    return db_path
+
+
+@pytest.fixture
+def sync_db_url(migrated_db_path: Path) -> str:
+    """Return the pysqlite URL of this test's migrated database."""
+
+    return f"sqlite+pysqlite:///{migrated_db_path}"
+
+
+@pytest.fixture
+def async_db_url(migrated_db_path: Path) -> str:
+    """Return the aiosqlite URL of this test's migrated database."""
+
+    return f"sqlite+aiosqlite:///{migrated_db_path}"
+
+
+@pytest.fixture
+def sync_engine_for() -> Iterator[Callable[[str], sa.Engine]]:
+    """Return a per-URL cached sync engine for arrange/assert SQL, disposed at teardown.
+
+    NullPool closes the DBAPI connection after each block, so the sync side never
+    keeps the SQLite file open while the async engine under test writes to it.
+    """
+
+    engines: dict[str, sa.Engine] = {}
+
+    def _get(sync_url: str) -> sa.Engine:
+        engine = engines.get(sync_url)
+        if engine is None:
+            engine = sa.create_engine(sync_url, poolclass=NullPool)
+            engines[sync_url] = engine
+        return engine
+
+    try:
+        yield _get
+    finally:
+        for engine in engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+async def session_factory_for() -> AsyncIterator[
+    Callable[[str], async_sessionmaker[AsyncSession]]
+]:
+    """Return a per-URL cached async session factory, disposing engines at teardown.
+
+    Helpers and the test body can share one engine for the same database instead
+    of each bootstrapping its own pool and aiosqlite connection.
+    """
+
+    factories: dict[str, async_sessionmaker[AsyncSession]] = {}
+
+    def _get(async_url: str) -> async_sessionmaker[AsyncSession]:
+        factory = factories.get(async_url)
+        if factory is None:
+            factory = create_session_factory(async_url)
+            factories[async_url] = factory
+        return factory
+
+    try:
+        yield _get
+    finally:
+        for factory in factories.values():
+            await factory.kw["bind"].dispose()
@@ -7,10 +7,8 @@ from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 from fastapi.testclient import TestClient
 
-from alembic import command
 from apps.bot_api.main import create_app
 from triage_automation.config import settings as settings_module
 from triage_automation.config.settings import load_settings
@@ -29,17 +27,6 @@ REQUIRED_ENV = {
 }
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-    return sync_url, async_url
-
-
 def _set_runtime_env(monkeypatch: pytest.MonkeyPatch, *, database_url: str) -> None:
     for key, value in REQUIRED_ENV.items():
         monkeypatch.setenv(key, value)
@@ -85,11 +72,11 @@ def _create_runtime_test_client() -> TestClient:
 
 @pytest.mark.asyncio
 async def test_startup_bootstrap_creates_first_admin_from_env_password(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "admin_bootstrap_env_password.db")
-    _set_runtime_env(monkeypatch, database_url=async_url)
+    _set_runtime_env(monkeypatch, database_url=async_db_url)
     _clear_bootstrap_env(monkeypatch)
     monkeypatch.setenv("BOOTSTRAP_ADMIN_EMAIL", "bootstrap-admin@example.org")
     monkeypatch.setenv("BOOTSTRAP_ADMIN_PASSWORD", "bootstrap-password")
@@ -109,7 +96,7 @@ async def test_startup_bootstrap_creates_first_admin_from_env_password(
     assert response.status_code == 200
     assert response.json()["role"] == "admin"
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         row = connection.execute(
             sa.text(
                 "SELECT email, role, is_active FROM users WHERE email = :email LIMIT 1"
@@ -127,12 +114,12 @@ async def test_startup_bootstrap_creates_first_admin_from_env_password(
 @pytest.mark.asyncio
 async def test_startup_bootstrap_reads_admin_password_from_file(
     tmp_path: Path,
+    async_db_url: str,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    _, async_url = _upgrade_head(tmp_path, "admin_bootstrap_password_file.db")
     password_file = tmp_path / "bootstrap-password.txt"
     password_file.write_text("bootstrap-from-file\n", encoding="utf-8")
-    _set_runtime_env(monkeypatch, database_url=async_url)
+    _set_runtime_env(monkeypatch, database_url=async_db_url)
     _clear_bootstrap_env(monkeypatch)
     monkeypatch.setenv("BOOTSTRAP_ADMIN_EMAIL", "file-admin@example.org")
     monkeypatch.setenv("BOOTSTRAP_ADMIN_PASSWORD_FILE", str(password_file))
@@ -155,16 +142,16 @@ async def test_startup_bootstrap_reads_admin_password_from_file(
 
 @pytest.mark.asyncio
 async def test_startup_bootstrap_does_not_create_admin_when_users_exist(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "admin_bootstrap_existing_user.db")
-    _set_runtime_env(monkeypatch, database_url=async_url)
+    _set_runtime_env(monkeypatch, database_url=async_db_url)
     _clear_bootstrap_env(monkeypatch)
     monkeypatch.setenv("BOOTSTRAP_ADMIN_EMAIL", "bootstrap-admin@example.org")
     monkeypatch.setenv("BOOTSTRAP_ADMIN_PASSWORD", "bootstrap-password")
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         _insert_user(connection, email="existing-reader@example.org", role="reader")
 
     try:
@@ -182,7 +169,7 @@ async def test_startup_bootstrap_does_not_create_admin_when_users_exist(
     assert response.status_code == 401
     assert response.json() == {"detail": "invalid credentials"}
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         count = connection.execute(sa.text("SELECT COUNT(*) AS count FROM users")).mappings().one()
 
     assert int(count["count"]) == 1
@@ -191,12 +178,12 @@ async def test_startup_bootstrap_does_not_create_admin_when_users_exist(
 @pytest.mark.asyncio
 async def test_startup_bootstrap_rejects_invalid_password_source_configuration(
     tmp_path: Path,
+    async_db_url: str,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    _, async_url = _upgrade_head(tmp_path, "admin_bootstrap_invalid_config.db")
     password_file = tmp_path / "bootstrap-password.txt"
     password_file.write_text("bootstrap-from-file\n", encoding="utf-8")
-    _set_runtime_env(monkeypatch, database_url=async_url)
+    _set_runtime_env(monkeypatch, database_url=async_db_url)
     _clear_bootstrap_env(monkeypatch)
     monkeypatch.setenv("BOOTSTRAP_ADMIN_EMAIL", "invalid-config@example.org")
     monkeypatch.setenv("BOOTSTRAP_ADMIN_PASSWORD", "bootstrap-password")
@@ -1,17 +1,14 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from typing import cast
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 
-from alembic import command
 from apps.bot_api import main as bot_api_main
 from triage_automation.application.ports.auth_token_repository_port import (
     AuthTokenRepositoryPort,
@@ -40,16 +37,6 @@ class _DummyAuthTokenRepository:
         raise RuntimeError("not used in route-shape test")
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-    return sync_url, async_url
-
-
 def _insert_user(
     connection: sa.Connection,
     *,
@@ -148,14 +135,14 @@ def test_build_runtime_app_exposes_existing_route_paths() -> None:
 
 
 def test_runtime_app_serves_monitoring_and_prompt_admin_routes_in_same_process(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "bot_api_runtime_same_process.db")
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-runtime-surface-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -165,11 +152,11 @@ def test_runtime_app_serves_monitoring_and_prompt_admin_routes_in_same_process(
             token=admin_token,
         )
 
-    auth_service = bot_api_main.build_auth_service(async_url)
-    auth_token_repository = bot_api_main.build_auth_token_repository(async_url)
+    auth_service = bot_api_main.build_auth_service(async_db_url)
+    auth_token_repository = bot_api_main.build_auth_token_repository(async_db_url)
     app = bot_api_main.build_runtime_app(
         token_service=token_service,
-        database_url=async_url,
+        database_url=async_db_url,
         auth_service=auth_service,
         auth_token_repository=auth_token_repository,
     )
@@ -188,13 +175,15 @@ def test_runtime_app_serves_monitoring_and_prompt_admin_routes_in_same_process(
     assert users_admin_response.headers["content-type"].startswith("text/html")
 
 
-def test_runtime_app_keeps_legacy_http_decision_route_absent(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "bot_api_runtime_matrix_only.db")
+def test_runtime_app_keeps_legacy_http_decision_route_absent(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-runtime-matrix-only-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -204,11 +193,11 @@ def test_runtime_app_keeps_legacy_http_decision_route_absent(tmp_path: Path) ->
             token=admin_token,
         )
 
-    auth_service = bot_api_main.build_auth_service(async_url)
-    auth_token_repository = bot_api_main.build_auth_token_repository(async_url)
+    auth_service = bot_api_main.build_auth_service(async_db_url)
+    auth_token_repository = bot_api_main.build_auth_token_repository(async_db_url)
     app = bot_api_main.build_runtime_app(
         token_service=token_service,
-        database_url=async_url,
+        database_url=async_db_url,
         auth_service=auth_service,
         auth_token_repository=auth_token_repository,
     )
@@ -1,12 +1,8 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from apps.bot_matrix.main import poll_room1_intake_once
 from triage_automation.application.services.room1_intake_service import Room1IntakeService
 from triage_automation.infrastructure.db.audit_repository import SqlAlchemyAuditRepository
@@ -35,18 +31,6 @@ class FakeMatrixRuntimeClient:
         return f"$processing-{self._counter}"
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _make_pdf_event(event_id: str) -> dict[str, object]:
     return {
         "event_id": event_id,
@@ -94,8 +78,10 @@ def _build_intake_service(
 
 
 @pytest.mark.asyncio
-async def test_valid_room1_pdf_event_routes_through_runtime_listener(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "bot_matrix_runtime_room1_valid.db")
+async def test_valid_room1_pdf_event_routes_through_runtime_listener(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     matrix_client = FakeMatrixRuntimeClient(
         [
             _build_room1_sync_payload(
@@ -104,7 +90,7 @@ async def test_valid_room1_pdf_event_routes_through_runtime_listener(tmp_path: P
             )
         ]
     )
-    intake_service = _build_intake_service(async_url, matrix_client)
+    intake_service = _build_intake_service(async_db_url, matrix_client)
 
     next_since, routed_count = await poll_room1_intake_once(
         matrix_client=matrix_client,
@@ -119,7 +105,7 @@ async def test_valid_room1_pdf_event_routes_through_runtime_listener(tmp_path: P
     assert routed_count == 1
     assert matrix_client.reply_calls == [("!room1:example.org", "$origin-1", "processando...")]
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_count = connection.execute(sa.text("SELECT COUNT(*) FROM cases")).scalar_one()
         job_count = connection.execute(sa.text("SELECT COUNT(*) FROM jobs")).scalar_one()
@@ -129,8 +115,10 @@ async def test_valid_room1_pdf_event_routes_through_runtime_listener(tmp_path: P
 
 
 @pytest.mark.asyncio
-async def test_unsupported_events_are_ignored_by_runtime_listener(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "bot_matrix_runtime_room1_ignored.db")
+async def test_unsupported_events_are_ignored_by_runtime_listener(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     matrix_client = FakeMatrixRuntimeClient(
         [
             _build_room1_sync_payload(
@@ -145,7 +133,7 @@ async def test_unsupported_events_are_ignored_by_runtime_listener(tmp_path: Path
             )
         ]
     )
-    intake_service = _build_intake_service(async_url, matrix_client)
+    intake_service = _build_intake_service(async_db_url, matrix_client)
 
     next_since, routed_count = await poll_room1_intake_once(
         matrix_client=matrix_client,
@@ -160,7 +148,7 @@ async def test_unsupported_events_are_ignored_by_runtime_listener(tmp_path: Path
     assert routed_count == 0
     assert matrix_client.reply_calls == []
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_count = connection.execute(sa.text("SELECT COUNT(*) FROM cases")).scalar_one()
         job_count = connection.execute(sa.text("SELECT COUNT(*) FROM jobs")).scalar_one()
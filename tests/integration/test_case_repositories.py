@@ -1,14 +1,11 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.application.ports.audit_repository_port import AuditEventCreateInput
 from triage_automation.application.ports.case_repository_port import (
     CaseCreateInput,
@@ -25,22 +22,9 @@ from triage_automation.infrastructure.db.message_repository import SqlAlchemyMes
 from triage_automation.infrastructure.db.session import create_session_factory
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 @pytest.mark.asyncio
-async def test_case_insert_works(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "case_insert.db")
-    session_factory = create_session_factory(async_url)
+async def test_case_insert_works(async_db_url: str) -> None:
+    session_factory = create_session_factory(async_db_url)
     repo = SqlAlchemyCaseRepository(session_factory)
 
     case_id = uuid4()
@@ -63,9 +47,10 @@ async def test_case_insert_works(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_duplicate_room1_origin_event_is_handled_deterministically(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "case_duplicate.db")
-    session_factory = create_session_factory(async_url)
+async def test_duplicate_room1_origin_event_is_handled_deterministically(
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     repo = SqlAlchemyCaseRepository(session_factory)
 
     payload = CaseCreateInput(
@@ -91,9 +76,11 @@ async def test_duplicate_room1_origin_event_is_handled_deterministically(tmp_pat
 
 
 @pytest.mark.asyncio
-async def test_append_only_audit_event_persistence(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "audit_insert.db")
-    session_factory = create_session_factory(async_url)
+async def test_append_only_audit_event_persistence(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
 
@@ -117,7 +104,7 @@ async def test_append_only_audit_event_persistence(tmp_path: Path) -> None:
         )
     )
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         row = connection.execute(
             sa.text("SELECT id, case_id, event_type FROM case_events WHERE id = :id"),
@@ -130,9 +117,11 @@ async def test_append_only_audit_event_persistence(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_duplicate_case_message_room_event_is_rejected_safely(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "message_duplicate.db")
-    session_factory = create_session_factory(async_url)
+async def test_duplicate_case_message_room_event_is_rejected_safely(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
     message_repo = SqlAlchemyMessageRepository(session_factory)
 
@@ -168,7 +157,7 @@ async def test_duplicate_case_message_room_event_is_rejected_safely(tmp_path: Pa
             )
         )
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         count = connection.execute(
             sa.text(
@@ -183,10 +172,10 @@ async def test_duplicate_case_message_room_event_is_rejected_safely(tmp_path: Pa
 
 @pytest.mark.asyncio
 async def test_full_transcript_persistence_and_chronological_timeline_per_case(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "full_transcript_timeline_case.db")
-    session_factory = create_session_factory(async_url)
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
 
     target_case_id = uuid4()
@@ -211,7 +200,7 @@ async def test_full_transcript_persistence_and_chronological_timeline_per_case(
     )
 
     base = datetime(2026, 2, 18, 9, 0, 0, tzinfo=UTC)
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         connection.execute(
             sa.text(
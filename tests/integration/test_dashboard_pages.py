@@ -2,15 +2,12 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 from fastapi.testclient import TestClient
 
-from alembic import command
 from apps.bot_api.main import create_app
 from triage_automation.application.services.auth_service import AuthService
 from triage_automation.infrastructure.db.auth_event_repository import SqlAlchemyAuthEventRepository
@@ -21,17 +18,6 @@ from triage_automation.infrastructure.security.password_hasher import BcryptPass
 from triage_automation.infrastructure.security.token_service import OpaqueTokenService
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-    return sync_url, async_url
-
-
 def _insert_user(
     connection: sa.Connection,
     *,
@@ -255,9 +241,9 @@ def _insert_llm_interaction(
 
 @pytest.mark.asyncio
 async def test_dashboard_case_list_page_renders_filters_and_paginated_rows_with_unpoly(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_page_list.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-dashboard-page-token"
@@ -267,7 +253,7 @@ async def test_dashboard_case_list_page_renders_filters_and_paginated_rows_with_
     case_c = uuid4()
     filter_date = today.date().isoformat()
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -313,7 +299,7 @@ async def test_dashboard_case_list_page_renders_filters_and_paginated_rows_with_
             captured_at=today - timedelta(minutes=30),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/dashboard/cases?page=1&page_size=2"
             f"&from_date={filter_date}&to_date={filter_date}",
@@ -336,9 +322,9 @@ async def test_dashboard_case_list_page_renders_filters_and_paginated_rows_with_
 
 @pytest.mark.asyncio
 async def test_dashboard_case_list_prefers_patient_name_and_record_number_identifier(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_page_patient_identifier.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-dashboard-patient-id-token"
@@ -346,7 +332,7 @@ async def test_dashboard_case_list_prefers_patient_name_and_record_number_identi
     case_id = uuid4()
     filter_date = now.date().isoformat()
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -375,7 +361,7 @@ async def test_dashboard_case_list_prefers_patient_name_and_record_number_identi
             captured_at=now - timedelta(minutes=5),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/dashboard/cases"
             f"?from_date={filter_date}&to_date={filter_date}",
@@ -389,9 +375,9 @@ async def test_dashboard_case_list_prefers_patient_name_and_record_number_identi
 
 @pytest.mark.asyncio
 async def test_dashboard_case_list_fragment_update_respects_filters_and_pagination(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_page_list_fragment.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-dashboard-page-fragment"
@@ -400,7 +386,7 @@ async def test_dashboard_case_list_fragment_update_respects_filters_and_paginati
     wait_case = uuid4()
     failed_case = uuid4()
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -434,7 +420,7 @@ async def test_dashboard_case_list_fragment_update_respects_filters_and_paginati
             captured_at=today - timedelta(minutes=6),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             (
                 "/dashboard/cases?page=1&page_size=10&status=WAIT_DOCTOR"
@@ -455,10 +441,10 @@ async def test_dashboard_case_list_fragment_update_respects_filters_and_paginati
 
 
 @pytest.mark.asyncio
-async def test_dashboard_case_list_requires_bearer_token(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "dashboard_page_list_auth_required.db")
-
-    with _build_client(async_url, token_service=OpaqueTokenService()) as client:
+async def test_dashboard_case_list_requires_bearer_token(
+    async_db_url: str,
+) -> None:
+    with _build_client(async_db_url, token_service=OpaqueTokenService()) as client:
         response = client.get("/dashboard/cases", follow_redirects=False)
 
     assert response.status_code == 303
@@ -466,8 +452,10 @@ async def test_dashboard_case_list_requires_bearer_token(tmp_path: Path) -> None
 
 
 @pytest.mark.asyncio
-async def test_dashboard_case_list_accepts_blank_status_query_parameter(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_page_list_blank_status.db")
+async def test_dashboard_case_list_accepts_blank_status_query_parameter(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-dashboard-blank-status"
@@ -475,7 +463,7 @@ async def test_dashboard_case_list_accepts_blank_status_query_parameter(tmp_path
     case_id = uuid4()
     filter_date = now.date().isoformat()
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -497,7 +485,7 @@ async def test_dashboard_case_list_accepts_blank_status_query_parameter(tmp_path
             captured_at=now - timedelta(minutes=5),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/dashboard/cases"
             f"?status=&from_date={filter_date}&to_date={filter_date}",
@@ -518,17 +506,17 @@ async def test_dashboard_case_list_accepts_blank_status_query_parameter(tmp_path
     ],
 )
 async def test_dashboard_case_list_accepts_reader_and_admin_roles(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
     role: str,
     token: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, f"dashboard_page_list_auth_{role}.db")
     token_service = OpaqueTokenService()
     user_id = uuid4()
     case_id = uuid4()
     now = datetime(2026, 2, 18, 12, 0, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(
             connection,
@@ -556,7 +544,7 @@ async def test_dashboard_case_list_accepts_reader_and_admin_roles(
         )
 
     filter_date = now.date().isoformat()
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/dashboard/cases"
             f"?from_date={filter_date}&to_date={filter_date}",
@@ -576,17 +564,17 @@ async def test_dashboard_case_list_accepts_reader_and_admin_roles(
     ],
 )
 async def test_dashboard_shell_navigation_is_role_aware(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
     role: str,
     token: str,
     shows_prompt_nav: bool,
     shows_users_nav: bool,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, f"dashboard_shell_nav_{role}.db")
     token_service = OpaqueTokenService()
     user_id = uuid4()
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(
             connection,
@@ -601,7 +589,7 @@ async def test_dashboard_shell_navigation_is_role_aware(
             token=token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/dashboard/cases",
             headers={"Authorization": f"Bearer {token}"},
@@ -621,15 +609,17 @@ async def test_dashboard_shell_navigation_is_role_aware(
 
 
 @pytest.mark.asyncio
-async def test_dashboard_list_and_detail_reuse_shared_shell_layout(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_shell_layout_reuse.db")
+async def test_dashboard_list_and_detail_reuse_shared_shell_layout(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-dashboard-shell-layout-token"
     case_id = uuid4()
     base = datetime(2026, 2, 18, 12, 0, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -645,7 +635,7 @@ async def test_dashboard_list_and_detail_reuse_shared_shell_layout(tmp_path: Pat
             updated_at=base - timedelta(minutes=10),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         list_response = client.get(
             "/dashboard/cases",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -670,10 +660,10 @@ async def test_dashboard_list_and_detail_reuse_shared_shell_layout(tmp_path: Pat
 
 @pytest.mark.asyncio
 async def test_dashboard_case_detail_page_renders_timeline_and_full_content_toggle_for_admin(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
     """Verifica se a página de detalhes renderiza histórico e toggle de conteúdo para admin."""
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_page_detail.db")
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-dashboard-detail-token"
@@ -681,7 +671,7 @@ async def test_dashboard_case_detail_page_renders_timeline_and_full_content_togg
     base = datetime(2026, 2, 18, 10, 0, 0, tzinfo=UTC)
     long_pdf_text = ("trecho " * 40) + "SEGREDO_FULL_ADMIN_ONLY_123"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -730,7 +720,7 @@ async def test_dashboard_case_detail_page_renders_timeline_and_full_content_togg
             captured_at=base + timedelta(minutes=15),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             f"/dashboard/cases/{case_id}?view=pure",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -763,8 +753,10 @@ async def test_dashboard_case_detail_page_renders_timeline_and_full_content_togg
 
 
 @pytest.mark.asyncio
-async def test_dashboard_case_detail_page_shows_excerpt_only_for_reader(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_page_detail_reader_excerpt.db")
+async def test_dashboard_case_detail_page_shows_excerpt_only_for_reader(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-dashboard-detail-token"
@@ -772,7 +764,7 @@ async def test_dashboard_case_detail_page_shows_excerpt_only_for_reader(tmp_path
     base = datetime(2026, 2, 18, 11, 0, 0, tzinfo=UTC)
     long_pdf_text = ("trecho " * 40) + "SEGREDO_FULL_ADMIN_ONLY_123"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -794,7 +786,7 @@ async def test_dashboard_case_detail_page_shows_excerpt_only_for_reader(tmp_path
             captured_at=base,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             f"/dashboard/cases/{case_id}?view=pure",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -808,17 +800,17 @@ async def test_dashboard_case_detail_page_shows_excerpt_only_for_reader(tmp_path
 
 @pytest.mark.asyncio
 async def test_dashboard_case_detail_page_renders_reaction_checkpoint_timeline_events(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
     """Verifica se a visualização pura exibe checkpoints de reação traduzidos."""
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_page_detail_reaction_events.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-dashboard-detail-reactions"
     case_id = uuid4()
     base = datetime(2026, 2, 18, 14, 0, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -856,7 +848,7 @@ async def test_dashboard_case_detail_page_renders_reaction_checkpoint_timeline_e
             reacted_at=base + timedelta(minutes=3),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             f"/dashboard/cases/{case_id}?view=pure",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -871,17 +863,17 @@ async def test_dashboard_case_detail_page_renders_reaction_checkpoint_timeline_e
 
 @pytest.mark.asyncio
 async def test_dashboard_case_detail_defaults_to_thread_view_with_decision_and_reactions(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
     """Verifica visualização padrão em etapas com decisão médica e reações traduzidas."""
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_page_detail_thread_default.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-dashboard-thread-default"
     case_id = uuid4()
     base = datetime(2026, 2, 18, 15, 0, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -1012,7 +1004,7 @@ async def test_dashboard_case_detail_defaults_to_thread_view_with_decision_and_r
             reacted_at=base + timedelta(minutes=12),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             f"/dashboard/cases/{case_id}",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -1033,17 +1025,17 @@ async def test_dashboard_case_detail_defaults_to_thread_view_with_decision_and_r
 
 @pytest.mark.asyncio
 async def test_dashboard_case_detail_shows_patient_name_and_record_number(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
     """Verifica se a página de detalhes exibe nome do paciente e número da ocorrência."""
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_detail_patient_info.db")
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-detail-patient-token"
     case_id = uuid4()
     now = datetime(2026, 2, 22, 12, 0, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -1072,7 +1064,7 @@ async def test_dashboard_case_detail_shows_patient_name_and_record_number(
             captured_at=now,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             f"/dashboard/cases/{case_id}",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -1087,7 +1079,10 @@ async def test_dashboard_case_detail_shows_patient_name_and_record_number(
 
 
 @pytest.mark.asyncio
-async def test_dashboard_case_list_respects_client_timezone_offset(tmp_path: Path) -> None:
+async def test_dashboard_case_list_respects_client_timezone_offset(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     """Verifica que a busca por data considera o timezone do cliente.
 
     Cenário:
@@ -1098,7 +1093,6 @@ async def test_dashboard_case_list_respects_client_timezone_offset(tmp_path: Pat
     - Backend ajusta a busca: 2026-02-22 03:00:00 UTC até 2026-02-23 03:00:00 UTC
     - O caso (armazenado como 00:30 UTC do dia 23) deve ser encontrado
     """
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_tz_offset.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-tz-offset-token"
@@ -1108,7 +1102,7 @@ async def test_dashboard_case_list_respects_client_timezone_offset(tmp_path: Pat
     # Dia local: 2026-02-22, mas em UTC já é 2026-02-23
     case_created_at_utc = datetime(2026, 2, 23, 0, 30, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -1132,7 +1126,7 @@ async def test_dashboard_case_list_respects_client_timezone_offset(tmp_path: Pat
 
     # Busca pela data LOCAL (22/02/2026) com offset do Brasil (-180 minutos)
     # Sem o ajuste, o caso não seria encontrado pois está armazenado como 23/02/2026 em UTC
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/dashboard/cases?from_date=2026-02-22&to_date=2026-02-22&tz_offset=-180",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -1146,7 +1140,10 @@ async def test_dashboard_case_list_respects_client_timezone_offset(tmp_path: Pat
 
 
 @pytest.mark.asyncio
-async def test_dashboard_case_list_without_tz_offset_uses_utc(tmp_path: Path) -> None:
+async def test_dashboard_case_list_without_tz_offset_uses_utc(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     """Verifica que sem tz_offset, a busca usa UTC puro (comportamento anterior).
 
     Cenário:
@@ -1154,7 +1151,6 @@ async def test_dashboard_case_list_without_tz_offset_uses_utc(tmp_path: Path) ->
     - Busca pela data 23/02/2026 SEM tz_offset (default = 0)
     - O caso deve ser encontrado
     """
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_tz_default.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-tz-default-token"
@@ -1162,7 +1158,7 @@ async def test_dashboard_case_list_without_tz_offset_uses_utc(tmp_path: Path) ->
 
     case_created_at_utc = datetime(2026, 2, 23, 0, 30, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -1185,7 +1181,7 @@ async def test_dashboard_case_list_without_tz_offset_uses_utc(tmp_path: Path) ->
         )
 
     # Busca pela data UTC sem offset
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/dashboard/cases?from_date=2026-02-23&to_date=2026-02-23",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -1196,9 +1192,11 @@ async def test_dashboard_case_list_without_tz_offset_uses_utc(tmp_path: Path) ->
 
 
 @pytest.mark.asyncio
-async def test_dashboard_case_list_tz_offset_preserved_in_pagination(tmp_path: Path) -> None:
+async def test_dashboard_case_list_tz_offset_preserved_in_pagination(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     """Verifica que o tz_offset é preservado nas URLs de paginação."""
-    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_tz_pagination.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-tz-pagination-token"
@@ -1206,7 +1204,7 @@ async def test_dashboard_case_list_tz_offset_preserved_in_pagination(tmp_path: P
     # Criar múltiplos casos para ter paginação
     base_time = datetime(2026, 2, 22, 12, 0, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -1231,7 +1229,7 @@ async def test_dashboard_case_list_tz_offset_preserved_in_pagination(tmp_path: P
             )
 
     # Busca com tz_offset e page_size=1 para forçar paginação
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/dashboard/cases?from_date=2026-02-22&to_date=2026-02-22&tz_offset=-180&page_size=1",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
+from collections.abc import Callable
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.ports.message_repository_port import CaseMessageCreateInput
 from triage_automation.application.services.execute_cleanup_service import (
@@ -59,18 +57,6 @@ class FakeRateLimitedRedactor:
         )
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _decode_json(value: object) -> dict[str, object]:
     if isinstance(value, str):
         parsed = json.loads(value)
@@ -82,10 +68,11 @@ def _decode_json(value: object) -> dict[str, object]:
 
 @pytest.mark.asyncio
 async def test_cleanup_redacts_messages_audits_results_and_marks_case_cleaned(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    sync_engine_for: Callable[[str], sa.Engine],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "cleanup_execute.db")
-    session_factory = create_session_factory(async_url)
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -148,8 +135,7 @@ async def test_cleanup_redacts_messages_audits_results_and_marks_case_cleaned(
         ("!room3:example.org", "$room3-request-1"),
     }
 
-    engine = sa.create_engine(sync_url)
-    with engine.begin() as connection:
+    with sync_engine_for(sync_db_url).begin() as connection:
         case_row = connection.execute(
             sa.text(
                 "SELECT status, cleanup_completed_at "
@@ -183,9 +169,12 @@ async def test_cleanup_redacts_messages_audits_results_and_marks_case_cleaned(
 
 
 @pytest.mark.asyncio
-async def test_cleanup_retries_matrix_rate_limit_and_completes(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "cleanup_execute_rate_limit.db")
-    session_factory = create_session_factory(async_url)
+async def test_cleanup_retries_matrix_rate_limit_and_completes(
+    sync_db_url: str,
+    async_db_url: str,
+    sync_engine_for: Callable[[str], sa.Engine],
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -241,8 +230,7 @@ async def test_cleanup_retries_matrix_rate_limit_and_completes(tmp_path: Path) -
     assert len(sleep_calls) == 1
     assert sleep_calls[0] >= 0.2
 
-    engine = sa.create_engine(sync_url)
-    with engine.begin() as connection:
+    with sync_engine_for(sync_db_url).begin() as connection:
         case_row = connection.execute(
             sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
             {"case_id": created_case.case_id.hex},
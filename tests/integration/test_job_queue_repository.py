@@ -1,38 +1,29 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from alembic import command
 from triage_automation.application.ports.job_queue_port import JobEnqueueInput
 from triage_automation.application.services.backoff import compute_retry_delay
 from triage_automation.infrastructure.db.job_queue_repository import SqlAlchemyJobQueueRepository
+from triage_automation.infrastructure.db.metadata import jobs
 from triage_automation.infrastructure.db.session import create_session_factory
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
-async def _enqueue_batch(repo: SqlAlchemyJobQueueRepository, count: int) -> list[int]:
-    created_ids: list[int] = []
-    for index in range(count):
-        record = await repo.enqueue(JobEnqueueInput(job_type=f"job-{index}"))
-        created_ids.append(record.job_id)
-    return created_ids
+async def _enqueue_batch(
+    session_factory: async_sessionmaker[AsyncSession],
+    count: int,
+) -> list[int]:
+    rows = [{"job_type": f"job-{index}", "payload": {}} for index in range(count)]
+    async with session_factory() as session:
+        result = await session.execute(sa.insert(jobs).returning(jobs.c.job_id), rows)
+        await session.commit()
+    return [int(job_id) for job_id in result.scalars().all()]
 
 
 async def _claim_one(repo: SqlAlchemyJobQueueRepository) -> list[int]:
@@ -40,63 +31,35 @@ async def _claim_one(repo: SqlAlchemyJobQueueRepository) -> list[int]:
     return [job.job_id for job in claimed]
 
 
-async def _load_job_status(sync_url: str, job_id: int) -> str:
-    engine = sa.create_engine(sync_url)
+def _load_job_row(engine: sa.Engine, job_id: int) -> sa.RowMapping:
     with engine.begin() as connection:
-        status = connection.execute(
-            sa.text("SELECT status FROM jobs WHERE job_id = :job_id"),
-            {"job_id": job_id},
-        ).scalar_one()
-    return str(status)
-
-
-async def _load_job_attempts(sync_url: str, job_id: int) -> int:
-    engine = sa.create_engine(sync_url)
-    with engine.begin() as connection:
-        attempts = connection.execute(
-            sa.text("SELECT attempts FROM jobs WHERE job_id = :job_id"),
-            {"job_id": job_id},
-        ).scalar_one()
-    return int(attempts)
-
-
-async def _load_job_run_after(sync_url: str, job_id: int) -> datetime:
-    engine = sa.create_engine(sync_url)
-    with engine.begin() as connection:
-        run_after = connection.execute(
-            sa.text("SELECT run_after FROM jobs WHERE job_id = :job_id"),
-            {"job_id": job_id},
-        ).scalar_one()
-
-    if isinstance(run_after, str):
-        return datetime.fromisoformat(run_after).replace(tzinfo=UTC)
-    return run_after
+        return (
+            connection.execute(
+                sa.text(
+                    "SELECT status, attempts, run_after, last_error, payload "
+                    "FROM jobs WHERE job_id = :job_id"
+                ),
+                {"job_id": job_id},
+            )
+            .mappings()
+            .one()
+        )
 
 
-async def _load_job_last_error(sync_url: str, job_id: int) -> str | None:
-    engine = sa.create_engine(sync_url)
-    with engine.begin() as connection:
-        value = connection.execute(
-            sa.text("SELECT last_error FROM jobs WHERE job_id = :job_id"),
-            {"job_id": job_id},
-        ).scalar_one_or_none()
+def _as_utc_datetime(value: object) -> datetime:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).replace(tzinfo=UTC)
+    assert isinstance(value, datetime)
     return value
 
 
-async def _load_job_payload(sync_url: str, job_id: int) -> str:
-    engine = sa.create_engine(sync_url)
-    with engine.begin() as connection:
-        payload = connection.execute(
-            sa.text("SELECT payload FROM jobs WHERE job_id = :job_id"),
-            {"job_id": job_id},
-        ).scalar_one()
-    return str(payload)
-
-
 @pytest.mark.asyncio
-async def test_enqueue_creates_queued_job(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "enqueue.db")
-    session_factory = create_session_factory(async_url)
+async def test_enqueue_creates_queued_job(
+    sync_db_url: str,
+    async_db_url: str,
+    sync_engine_for: Callable[[str], sa.Engine],
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     repo = SqlAlchemyJobQueueRepository(session_factory)
 
     record = await repo.enqueue(
@@ -111,18 +74,20 @@ async def test_enqueue_creates_queued_job(tmp_path: Path) -> None:
     assert record.job_type == "process_pdf_case"
     assert record.max_attempts == 7
     assert record.attempts == 0
-    assert await _load_job_status(sync_url, record.job_id) == "queued"
-    assert "key" in await _load_job_payload(sync_url, record.job_id)
+    row = _load_job_row(sync_engine_for(sync_db_url), record.job_id)
+    assert row["status"] == "queued"
+    assert "key" in str(row["payload"])
 
 
 @pytest.mark.asyncio
-async def test_concurrent_claims_get_distinct_jobs(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "concurrent_claim.db")
-    session_factory = create_session_factory(async_url)
+async def test_concurrent_claims_get_distinct_jobs(
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     repo_one = SqlAlchemyJobQueueRepository(session_factory)
     repo_two = SqlAlchemyJobQueueRepository(session_factory)
 
-    await _enqueue_batch(repo_one, 2)
+    await _enqueue_batch(session_factory, 2)
 
     claimed_one, claimed_two = await asyncio.gather(_claim_one(repo_one), _claim_one(repo_two))
 
@@ -132,9 +97,10 @@ async def test_concurrent_claims_get_distinct_jobs(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_run_after_scheduling_is_respected(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "run_after.db")
-    session_factory = create_session_factory(async_url)
+async def test_run_after_scheduling_is_respected(
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     repo = SqlAlchemyJobQueueRepository(session_factory)
 
     future_time = datetime.now(tz=UTC) + timedelta(hours=1)
@@ -146,9 +112,12 @@ async def test_run_after_scheduling_is_respected(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_schedule_retry_updates_attempts_and_run_after(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "retry.db")
-    session_factory = create_session_factory(async_url)
+async def test_schedule_retry_updates_attempts_and_run_after(
+    sync_db_url: str,
+    async_db_url: str,
+    sync_engine_for: Callable[[str], sa.Engine],
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     repo = SqlAlchemyJobQueueRepository(session_factory)
 
     created = await repo.enqueue(JobEnqueueInput(job_type="retryable"))
@@ -163,17 +132,18 @@ async def test_schedule_retry_updates_attempts_and_run_after(tmp_path: Path) ->
 
     assert retried.status == "queued"
     assert retried.attempts == 1
-    persisted_attempts = await _load_job_attempts(sync_url, created.job_id)
-    assert persisted_attempts == 1
-
-    persisted_run_after = await _load_job_run_after(sync_url, created.job_id)
-    assert persisted_run_after >= datetime.now(tz=UTC)
+    row = _load_job_row(sync_engine_for(sync_db_url), created.job_id)
+    assert int(row["attempts"]) == 1
+    assert _as_utc_datetime(row["run_after"]) >= datetime.now(tz=UTC)
 
 
 @pytest.mark.asyncio
-async def test_mark_dead_sets_dead_status(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "dead.db")
-    session_factory = create_session_factory(async_url)
+async def test_mark_dead_sets_dead_status(
+    sync_db_url: str,
+    async_db_url: str,
+    sync_engine_for: Callable[[str], sa.Engine],
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     repo = SqlAlchemyJobQueueRepository(session_factory)
 
     created = await repo.enqueue(JobEnqueueInput(job_type="dead-letter"))
@@ -182,5 +152,6 @@ async def test_mark_dead_sets_dead_status(tmp_path: Path) -> None:
 
     assert dead.status == "dead"
     assert dead.last_error == "max attempts reached"
-    assert await _load_job_status(sync_url, created.job_id) == "dead"
-    assert await _load_job_last_error(sync_url, created.job_id) == "max attempts reached"
+    row = _load_job_row(sync_engine_for(sync_db_url), created.job_id)
+    assert row["status"] == "dead"
+    assert row["last_error"] == "max attempts reached"
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.services.llm1_service import Llm1Service
 from triage_automation.application.services.llm2_service import Llm2Service
@@ -82,18 +79,6 @@ def _build_simple_pdf(text: str) -> bytes:
     return b"".join(parts)
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _valid_llm1_payload(agency_record_number: str) -> dict[str, object]:
     return {
         "schema_version": "1.1",
@@ -194,11 +179,11 @@ def _insert_prompt(
 
 @pytest.mark.asyncio
 async def test_llm1_and_llm2_load_active_prompts_and_audit_prompt_versions(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "llm_prompt_loading_runtime.db")
-    session_factory = create_session_factory(async_url)
-    engine = sa.create_engine(sync_url)
+    session_factory = create_session_factory(async_db_url)
+    engine = sa.create_engine(sync_db_url)
 
     with engine.begin() as connection:
         _insert_prompt(
@@ -317,9 +302,10 @@ async def test_llm1_and_llm2_load_active_prompts_and_audit_prompt_versions(
 
 
 @pytest.mark.asyncio
-async def test_default_prompt_names_resolve_seeded_rows(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "llm_prompt_seeded_defaults.db")
-    session_factory = create_session_factory(async_url)
+async def test_default_prompt_names_resolve_seeded_rows(
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     prompt_service = PromptTemplateService(
         prompt_templates=SqlAlchemyPromptTemplateRepository(session_factory)
@@ -362,9 +348,10 @@ async def test_default_prompt_names_resolve_seeded_rows(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_missing_active_prompt_is_explicit_and_retriable_for_job_path(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "llm_prompt_missing.db")
-    session_factory = create_session_factory(async_url)
+async def test_missing_active_prompt_is_explicit_and_retriable_for_job_path(
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     prompt_service = PromptTemplateService(
         prompt_templates=SqlAlchemyPromptTemplateRepository(session_factory)
@@ -1,17 +1,14 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 
-from alembic import command
 from apps.bot_api.main import create_app
 from triage_automation.application.services.auth_service import AuthService
 from triage_automation.infrastructure.db.auth_event_repository import SqlAlchemyAuthEventRepository
@@ -22,18 +19,6 @@ from triage_automation.infrastructure.security.password_hasher import BcryptPass
 from triage_automation.infrastructure.security.token_service import OpaqueTokenService
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _insert_user(
     connection: sa.Connection,
     *,
@@ -76,8 +61,10 @@ def _build_client(async_url: str, *, token_service: OpaqueTokenService | None =
 
 
 @pytest.mark.asyncio
-async def test_valid_credentials_return_opaque_token_role_and_persist_hash(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "login_success.db")
+async def test_valid_credentials_return_opaque_token_role_and_persist_hash(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     user_id = uuid4()
     hasher = BcryptPasswordHasher()
     fixed_now = datetime(2026, 2, 15, 0, 0, 0, tzinfo=UTC)
@@ -87,7 +74,7 @@ async def test_valid_credentials_return_opaque_token_role_and_persist_hash(tmp_p
         now=lambda: fixed_now,
     )
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(
             connection,
@@ -98,7 +85,7 @@ async def test_valid_credentials_return_opaque_token_role_and_persist_hash(tmp_p
             is_active=True,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/auth/login",
             json={"email": "admin@example.org", "password": "correct-password"},
@@ -134,12 +121,14 @@ async def test_valid_credentials_return_opaque_token_role_and_persist_hash(tmp_p
 
 
 @pytest.mark.asyncio
-async def test_invalid_credentials_return_auth_error_and_no_token_row(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "login_invalid.db")
+async def test_invalid_credentials_return_auth_error_and_no_token_row(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     user_id = uuid4()
     hasher = BcryptPasswordHasher()
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(
             connection,
@@ -150,7 +139,7 @@ async def test_invalid_credentials_return_auth_error_and_no_token_row(tmp_path:
             is_active=True,
         )
 
-    with _build_client(async_url) as client:
+    with _build_client(async_db_url) as client:
         response = client.post(
             "/auth/login",
             json={"email": "admin@example.org", "password": "wrong-password"},
@@ -174,12 +163,14 @@ async def test_invalid_credentials_return_auth_error_and_no_token_row(tmp_path:
 
 
 @pytest.mark.asyncio
-async def test_inactive_user_returns_forbidden_and_no_token_row(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "login_inactive.db")
+async def test_inactive_user_returns_forbidden_and_no_token_row(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     user_id = uuid4()
     hasher = BcryptPasswordHasher()
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(
             connection,
@@ -190,7 +181,7 @@ async def test_inactive_user_returns_forbidden_and_no_token_row(tmp_path: Path)
             is_active=False,
         )
 
-    with _build_client(async_url) as client:
+    with _build_client(async_db_url) as client:
         response = client.post(
             "/auth/login",
             json={"email": "reader@example.org", "password": "reader-password"},
@@ -213,10 +204,10 @@ async def test_inactive_user_returns_forbidden_and_no_token_row(tmp_path: Path)
 
 
 @pytest.mark.asyncio
-async def test_route_paths_include_login_and_monitoring_list(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "login_routes.db")
-
-    with _build_client(async_url) as client:
+async def test_route_paths_include_login_and_monitoring_list(
+    async_db_url: str,
+) -> None:
+    with _build_client(async_db_url) as client:
         app = client.app
         assert isinstance(app, FastAPI)
         paths = {route.path for route in app.routes if isinstance(route, APIRoute)}
@@ -245,10 +236,10 @@ async def test_route_paths_include_login_and_monitoring_list(tmp_path: Path) ->
 
 
 @pytest.mark.asyncio
-async def test_legacy_callback_and_widget_endpoints_are_absent(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "login_legacy_endpoints_absent.db")
-
-    with _build_client(async_url) as client:
+async def test_legacy_callback_and_widget_endpoints_are_absent(
+    async_db_url: str,
+) -> None:
+    with _build_client(async_db_url) as client:
         assert client.post("/callbacks/triage-decision", json={}).status_code == 404
         assert client.get("/widget/room2").status_code == 404
         assert client.get("/widget/room2/app.js").status_code == 404
@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from apps.worker.main import build_worker_runtime
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.ports.job_queue_port import JobEnqueueInput, JobRecord
@@ -22,18 +19,6 @@ from triage_automation.infrastructure.db.job_queue_repository import SqlAlchemyJ
 from triage_automation.infrastructure.db.session import create_session_factory
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 async def _create_case(
     case_repo: SqlAlchemyCaseRepository,
     *,
@@ -77,10 +62,10 @@ def _runtime_settings(*, database_url: str) -> Settings:
 
 @pytest.mark.asyncio
 async def test_max_retries_marks_job_dead_marks_case_failed_and_enqueues_failure_final_reply(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "max_retries_failure.db")
-    session_factory = create_session_factory(async_url)
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -120,7 +105,7 @@ async def test_max_retries_marks_job_dead_marks_case_failed_and_enqueues_failure
 
     assert claimed_count == 1
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         failed_job = connection.execute(
             sa.text(
@@ -159,9 +144,11 @@ async def test_max_retries_marks_job_dead_marks_case_failed_and_enqueues_failure
 
 
 @pytest.mark.asyncio
-async def test_recovery_scan_enqueues_missing_jobs_once_without_duplicates(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "recovery_scan.db")
-    session_factory = create_session_factory(async_url)
+async def test_recovery_scan_enqueues_missing_jobs_once_without_duplicates(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -202,7 +189,7 @@ async def test_recovery_scan_enqueues_missing_jobs_once_without_duplicates(tmp_p
     assert first_run.enqueued_jobs == 2
     assert second_run.enqueued_jobs == 0
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         jobs = connection.execute(
             sa.text(
@@ -228,9 +215,11 @@ async def test_recovery_scan_enqueues_missing_jobs_once_without_duplicates(tmp_p
 
 
 @pytest.mark.asyncio
-async def test_runtime_wiring_dead_letters_at_max_attempts_boundary(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "runtime_dead_letter_boundary.db")
-    session_factory = create_session_factory(async_url)
+async def test_runtime_wiring_dead_letters_at_max_attempts_boundary(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     queue_repo = SqlAlchemyJobQueueRepository(session_factory)
@@ -250,7 +239,7 @@ async def test_runtime_wiring_dead_letters_at_max_attempts_boundary(tmp_path: Pa
     )
 
     runtime = build_worker_runtime(
-        settings=_runtime_settings(database_url=async_url),
+        settings=_runtime_settings(database_url=async_db_url),
         session_factory=session_factory,
     )
 
@@ -258,7 +247,7 @@ async def test_runtime_wiring_dead_letters_at_max_attempts_boundary(tmp_path: Pa
 
     assert claimed_count == 1
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         job_row = connection.execute(
             sa.text("SELECT status, attempts, last_error FROM jobs WHERE job_id = :job_id"),
@@ -1,29 +1,36 @@
 from __future__ import annotations
 
 import re
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 
+@pytest.fixture(scope="module")
+def database_url(tmp_path_factory: pytest.TempPathFactory, migrated_db_template: Path) -> str:
+    db_path = tmp_path_factory.mktemp("migration") / "slice_dashboard_llm_interactions.db"
+    shutil.copyfile(migrated_db_template, db_path)
+    return f"sqlite+pysqlite:///{db_path}"
 
-def _upgrade_head(tmp_path: Path) -> str:
-    db_path = tmp_path / "slice_dashboard_llm_interactions.db"
-    database_url = f"sqlite+pysqlite:///{db_path}"
 
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", database_url)
-    command.upgrade(alembic_config, "head")
-    return database_url
+@pytest.fixture(scope="module")
+def engine(database_url: str) -> Iterator[sa.Engine]:
+    engine = sa.create_engine(database_url)
+    yield engine
+    engine.dispose()
 
 
-def test_case_llm_interactions_table_exists_with_required_columns(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
-    inspector = sa.inspect(engine)
+@pytest.fixture(scope="module")
+def inspector(engine: sa.Engine) -> sa.Inspector:
+    return sa.inspect(engine)
+
 
+def test_case_llm_interactions_table_exists_with_required_columns(
+    inspector: sa.Inspector,
+) -> None:
     assert "case_llm_interactions" in set(inspector.get_table_names())
 
     columns = {column["name"] for column in inspector.get_columns("case_llm_interactions")}
@@ -42,11 +49,9 @@ def test_case_llm_interactions_table_exists_with_required_columns(tmp_path: Path
     }
 
 
-def test_case_llm_interactions_has_case_fk_and_stage_check(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
-    inspector = sa.inspect(engine)
-
+def test_case_llm_interactions_has_case_fk_and_stage_check(
+    inspector: sa.Inspector,
+) -> None:
     foreign_keys = inspector.get_foreign_keys("case_llm_interactions")
     assert any(
         foreign_key["referred_table"] == "cases"
@@ -1,28 +1,35 @@
 from __future__ import annotations
 
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 
+@pytest.fixture(scope="module")
+def database_url(tmp_path_factory: pytest.TempPathFactory, migrated_db_template: Path) -> str:
+    db_path = tmp_path_factory.mktemp("migration") / "slice_dashboard_report_transcripts.db"
+    shutil.copyfile(migrated_db_template, db_path)
+    return f"sqlite+pysqlite:///{db_path}"
 
-def _upgrade_head(tmp_path: Path) -> str:
-    db_path = tmp_path / "slice_dashboard_report_transcripts.db"
-    database_url = f"sqlite+pysqlite:///{db_path}"
 
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", database_url)
-    command.upgrade(alembic_config, "head")
-    return database_url
+@pytest.fixture(scope="module")
+def engine(database_url: str) -> Iterator[sa.Engine]:
+    engine = sa.create_engine(database_url)
+    yield engine
+    engine.dispose()
 
 
-def test_case_report_transcripts_table_exists_with_required_columns(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
-    inspector = sa.inspect(engine)
+@pytest.fixture(scope="module")
+def inspector(engine: sa.Engine) -> sa.Inspector:
+    return sa.inspect(engine)
+
 
+def test_case_report_transcripts_table_exists_with_required_columns(
+    inspector: sa.Inspector,
+) -> None:
     assert "case_report_transcripts" in set(inspector.get_table_names())
 
     columns = {
@@ -34,11 +41,9 @@ def test_case_report_transcripts_table_exists_with_required_columns(tmp_path: Pa
     assert columns["captured_at"]["nullable"] is False
 
 
-def test_case_report_transcripts_case_id_foreign_key_points_to_cases(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
-    inspector = sa.inspect(engine)
-
+def test_case_report_transcripts_case_id_foreign_key_points_to_cases(
+    inspector: sa.Inspector,
+) -> None:
     foreign_keys = inspector.get_foreign_keys("case_report_transcripts")
     assert any(
         foreign_key["referred_table"] == "cases"
@@ -1,27 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 import sqlalchemy as sa
-from alembic.config import Config
-
-from alembic import command
-
-
-def _upgrade_head(tmp_path: Path) -> str:
-    db_path = tmp_path / "slice3_migration.db"
-    database_url = f"sqlite+pysqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", database_url)
-
-    command.upgrade(alembic_config, "head")
-    return database_url
 
 
-def test_migration_creates_required_tables(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
+def test_migration_creates_required_tables(sync_db_url: str) -> None:
+    engine = sa.create_engine(sync_db_url)
 
     inspector = sa.inspect(engine)
     table_names = set(inspector.get_table_names())
@@ -32,9 +15,10 @@ def test_migration_creates_required_tables(tmp_path: Path) -> None:
     assert "jobs" in table_names
 
 
-def test_migration_creates_required_uniques_and_indexes(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
+def test_migration_creates_required_uniques_and_indexes(
+    sync_db_url: str,
+) -> None:
+    engine = sa.create_engine(sync_db_url)
     inspector = sa.inspect(engine)
 
     cases_uniques = {
@@ -67,9 +51,8 @@ def test_migration_creates_required_uniques_and_indexes(tmp_path: Path) -> None:
     assert "ix_jobs_case_id" in jobs_indexes
 
 
-def test_jobs_status_default_is_queued(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
+def test_jobs_status_default_is_queued(sync_db_url: str) -> None:
+    engine = sa.create_engine(sync_db_url)
 
     with engine.begin() as connection:
         connection.execute(sa.text("INSERT INTO jobs (job_type) VALUES ('process_pdf_case')"))
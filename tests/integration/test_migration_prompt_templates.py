@@ -10,7 +10,7 @@ from alembic.config import Config
 from alembic import command
 
 
-def _upgrade_head(tmp_path: Path, revision: str = "head") -> str:
+def _upgrade_to(tmp_path: Path, revision: str) -> str:
     db_path = tmp_path / "slice19_prompt_templates.db"
     database_url = f"sqlite+pysqlite:///{db_path}"
 
@@ -22,10 +22,9 @@ def _upgrade_head(tmp_path: Path, revision: str = "head") -> str:
 
 
 def test_prompt_templates_table_exists_with_required_columns_and_seed_rows(
-    tmp_path: Path,
+    sync_db_url: str,
 ) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
+    engine = sa.create_engine(sync_db_url)
     inspector = sa.inspect(engine)
 
     assert "prompt_templates" in set(inspector.get_table_names())
@@ -62,9 +61,10 @@ def test_prompt_templates_table_exists_with_required_columns_and_seed_rows(
     assert all(str(row["content"]).strip() != "" for row in rows)
 
 
-def test_prompt_templates_indexes_and_constraints_are_enforced(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
+def test_prompt_templates_indexes_and_constraints_are_enforced(
+    sync_db_url: str,
+) -> None:
+    engine = sa.create_engine(sync_db_url)
     inspector = sa.inspect(engine)
 
     uniques = {
@@ -163,7 +163,7 @@ def test_prompt_templates_indexes_and_constraints_are_enforced(tmp_path: Path) -
 
 
 def test_prompt_templates_updated_by_user_id_has_no_foreign_key_yet(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path, revision="0002_prompt_templates")
+    database_url = _upgrade_to(tmp_path, "0002_prompt_templates")
     engine = sa.create_engine(database_url)
     inspector = sa.inspect(engine)
 
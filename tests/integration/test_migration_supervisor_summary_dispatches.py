@@ -1,33 +1,36 @@
 from __future__ import annotations
 
+import shutil
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 
+@pytest.fixture(scope="module")
+def database_url(tmp_path_factory: pytest.TempPathFactory, migrated_db_template: Path) -> str:
+    db_path = tmp_path_factory.mktemp("migration") / "slice_room4_summary_dispatches.db"
+    shutil.copyfile(migrated_db_template, db_path)
+    return f"sqlite+pysqlite:///{db_path}"
 
-def _upgrade_head(tmp_path: Path) -> str:
-    db_path = tmp_path / "slice_room4_summary_dispatches.db"
-    database_url = f"sqlite+pysqlite:///{db_path}"
 
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", database_url)
-    command.upgrade(alembic_config, "head")
+@pytest.fixture(scope="module")
+def engine(database_url: str) -> Iterator[sa.Engine]:
+    engine = sa.create_engine(database_url)
+    yield engine
+    engine.dispose()
+
 
-    return database_url
+@pytest.fixture(scope="module")
+def inspector(engine: sa.Engine) -> sa.Inspector:
+    return sa.inspect(engine)
 
 
 def test_supervisor_summary_dispatches_table_has_unique_window_identity(
-    tmp_path: Path,
+    inspector: sa.Inspector,
 ) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
-    inspector = sa.inspect(engine)
-
     table_names = set(inspector.get_table_names())
     assert "supervisor_summary_dispatches" in table_names
 
@@ -39,11 +42,8 @@ def test_supervisor_summary_dispatches_table_has_unique_window_identity(
 
 
 def test_supervisor_summary_dispatches_rejects_duplicate_window_for_same_room(
-    tmp_path: Path,
+    engine: sa.Engine,
 ) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
-
     window_start = datetime(2026, 2, 15, 19, 0, tzinfo=UTC)
     window_end = datetime(2026, 2, 16, 7, 0, tzinfo=UTC)
 
@@ -1,23 +1,26 @@
 from __future__ import annotations
 
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 
+@pytest.fixture(scope="module")
+def database_url(tmp_path_factory: pytest.TempPathFactory, migrated_db_template: Path) -> str:
+    db_path = tmp_path_factory.mktemp("migration") / "slice_dashboard_transcript_append_only.db"
+    shutil.copyfile(migrated_db_template, db_path)
+    return f"sqlite+pysqlite:///{db_path}"
 
-def _upgrade_head(tmp_path: Path) -> str:
-    db_path = tmp_path / "slice_dashboard_transcript_append_only.db"
-    database_url = f"sqlite+pysqlite:///{db_path}"
 
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", database_url)
-    command.upgrade(alembic_config, "head")
-    return database_url
+@pytest.fixture(scope="module")
+def engine(database_url: str) -> Iterator[sa.Engine]:
+    engine = sa.create_engine(database_url)
+    yield engine
+    engine.dispose()
 
 
 def _insert_minimal_case(connection: sa.Connection) -> str:
@@ -79,14 +82,11 @@ def _insert_minimal_case(connection: sa.Connection) -> str:
     ],
 )
 def test_transcript_tables_are_append_only(
-    tmp_path: Path,
+    engine: sa.Engine,
     table_name: str,
     insert_sql: str,
     insert_params: dict[str, str],
 ) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
-
     with engine.begin() as connection:
         case_id = _insert_minimal_case(connection)
         connection.execute(sa.text(insert_sql), {"case_id": case_id, **insert_params})
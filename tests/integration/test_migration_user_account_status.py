@@ -16,13 +16,10 @@ def _configure_alembic(database_url: str) -> Config:
     return alembic_config
 
 
-def test_users_schema_includes_account_status_column_and_constraint(tmp_path: Path) -> None:
-    db_path = tmp_path / "slice_user_account_status_schema.db"
-    database_url = f"sqlite+pysqlite:///{db_path}"
-
-    command.upgrade(_configure_alembic(database_url), "head")
-
-    engine = sa.create_engine(database_url)
+def test_users_schema_includes_account_status_column_and_constraint(
+    sync_db_url: str,
+) -> None:
+    engine = sa.create_engine(sync_db_url)
     inspector = sa.inspect(engine)
     columns = {column["name"]: column for column in inspector.get_columns("users")}
     assert "account_status" in columns
@@ -79,13 +76,10 @@ def test_upgrade_from_0012_maps_legacy_users_to_account_status(tmp_path: Path) -
     assert bool(by_email["blocked@example.org"]["is_active"]) is False
 
 
-def test_users_schema_rejects_invalid_account_status_value(tmp_path: Path) -> None:
-    db_path = tmp_path / "slice_user_account_status_invalid_value.db"
-    database_url = f"sqlite+pysqlite:///{db_path}"
-
-    command.upgrade(_configure_alembic(database_url), "head")
-
-    engine = sa.create_engine(database_url)
+def test_users_schema_rejects_invalid_account_status_value(
+    sync_db_url: str,
+) -> None:
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         with pytest.raises(sa.exc.IntegrityError):
             connection.execute(
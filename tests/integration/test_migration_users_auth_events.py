@@ -1,29 +1,36 @@
 from __future__ import annotations
 
 import re
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 
+@pytest.fixture(scope="module")
+def database_url(tmp_path_factory: pytest.TempPathFactory, migrated_db_template: Path) -> str:
+    db_path = tmp_path_factory.mktemp("migration") / "slice22_users_auth.db"
+    shutil.copyfile(migrated_db_template, db_path)
+    return f"sqlite+pysqlite:///{db_path}"
 
-def _upgrade_head(tmp_path: Path) -> str:
-    db_path = tmp_path / "slice22_users_auth.db"
-    database_url = f"sqlite+pysqlite:///{db_path}"
 
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", database_url)
-    command.upgrade(alembic_config, "head")
-    return database_url
+@pytest.fixture(scope="module")
+def engine(database_url: str) -> Iterator[sa.Engine]:
+    engine = sa.create_engine(database_url)
+    yield engine
+    engine.dispose()
 
 
-def test_users_schema_has_unique_email_and_role_check_constraint(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
-    inspector = sa.inspect(engine)
+@pytest.fixture(scope="module")
+def inspector(engine: sa.Engine) -> sa.Inspector:
+    return sa.inspect(engine)
 
+
+def test_users_schema_has_unique_email_and_role_check_constraint(
+    inspector: sa.Inspector,
+) -> None:
     assert "users" in set(inspector.get_table_names())
 
     unique_constraints = {
@@ -44,11 +51,9 @@ def test_users_schema_has_unique_email_and_role_check_constraint(tmp_path: Path)
     assert values == {"admin", "reader"}
 
 
-def test_auth_events_and_auth_tokens_schema_with_expected_indexes_and_fks(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
-    inspector = sa.inspect(engine)
-
+def test_auth_events_and_auth_tokens_schema_with_expected_indexes_and_fks(
+    inspector: sa.Inspector,
+) -> None:
     assert "auth_events" in set(inspector.get_table_names())
     assert "auth_tokens" in set(inspector.get_table_names())
 
@@ -69,11 +74,9 @@ def test_auth_events_and_auth_tokens_schema_with_expected_indexes_and_fks(tmp_pa
     )
 
 
-def test_prompt_templates_updated_by_user_fk_exists_after_migration(tmp_path: Path) -> None:
-    database_url = _upgrade_head(tmp_path)
-    engine = sa.create_engine(database_url)
-    inspector = sa.inspect(engine)
-
+def test_prompt_templates_updated_by_user_fk_exists_after_migration(
+    inspector: sa.Inspector,
+) -> None:
     prompt_template_fks = inspector.get_foreign_keys("prompt_templates")
     assert any(
         fk["referred_table"] == "users" and fk["constrained_columns"] == ["updated_by_user_id"]
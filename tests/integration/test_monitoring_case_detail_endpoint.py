@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 from fastapi.testclient import TestClient
 
-from alembic import command
 from apps.bot_api.main import create_app
 from triage_automation.application.services.auth_service import AuthService
 from triage_automation.infrastructure.db.auth_event_repository import SqlAlchemyAuthEventRepository
@@ -20,17 +17,6 @@ from triage_automation.infrastructure.security.password_hasher import BcryptPass
 from triage_automation.infrastructure.security.token_service import OpaqueTokenService
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-    return sync_url, async_url
-
-
 def _insert_user(
     connection: sa.Connection,
     *,
@@ -164,16 +150,16 @@ def _build_client(async_url: str, *, token_service: OpaqueTokenService) -> TestC
 
 @pytest.mark.asyncio
 async def test_monitoring_case_detail_returns_unified_chronological_timeline(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "monitoring_case_detail.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-detail-token"
     case_id = uuid4()
     base = datetime(2026, 2, 18, 10, 0, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -232,7 +218,7 @@ async def test_monitoring_case_detail_returns_unified_chronological_timeline(
             },
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             f"/monitoring/cases/{case_id}",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -262,14 +248,16 @@ async def test_monitoring_case_detail_returns_unified_chronological_timeline(
 
 
 @pytest.mark.asyncio
-async def test_monitoring_case_detail_returns_not_found_for_unknown_case(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "monitoring_case_detail_not_found.db")
+async def test_monitoring_case_detail_returns_not_found_for_unknown_case(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-detail-not-found"
     unknown_case_id = uuid4()
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -279,7 +267,7 @@ async def test_monitoring_case_detail_returns_not_found_for_unknown_case(tmp_pat
             token=reader_token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             f"/monitoring/cases/{unknown_case_id}",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -291,16 +279,16 @@ async def test_monitoring_case_detail_returns_not_found_for_unknown_case(tmp_pat
 
 @pytest.mark.asyncio
 async def test_monitoring_case_detail_includes_reaction_checkpoint_events(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "monitoring_case_detail_reactions.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-detail-reaction-events"
     case_id = uuid4()
     base = datetime(2026, 2, 18, 12, 0, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -338,7 +326,7 @@ async def test_monitoring_case_detail_includes_reaction_checkpoint_events(
             reacted_at=base + timedelta(minutes=4),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             f"/monitoring/cases/{case_id}",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -367,16 +355,16 @@ async def test_monitoring_case_detail_includes_reaction_checkpoint_events(
 
 @pytest.mark.asyncio
 async def test_monitoring_case_detail_includes_ack_and_human_reply_as_distinct_events(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "monitoring_case_detail_ack_human.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-detail-ack-human"
     case_id = uuid4()
     base = datetime(2026, 2, 18, 11, 0, 0, tzinfo=UTC)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -408,7 +396,7 @@ async def test_monitoring_case_detail_includes_ack_and_human_reply_as_distinct_e
             },
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             f"/monitoring/cases/{case_id}",
             headers={"Authorization": f"Bearer {reader_token}"},
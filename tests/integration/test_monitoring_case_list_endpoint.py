@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 from fastapi.testclient import TestClient
 
-from alembic import command
 from apps.bot_api.main import create_app
 from triage_automation.application.services.auth_service import AuthService
 from triage_automation.infrastructure.db.auth_event_repository import SqlAlchemyAuthEventRepository
@@ -20,17 +17,6 @@ from triage_automation.infrastructure.security.password_hasher import BcryptPass
 from triage_automation.infrastructure.security.token_service import OpaqueTokenService
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-    return sync_url, async_url
-
-
 def _insert_user(
     connection: sa.Connection,
     *,
@@ -188,9 +174,9 @@ def _build_client(async_url: str, *, token_service: OpaqueTokenService) -> TestC
 
 @pytest.mark.asyncio
 async def test_monitoring_case_list_orders_by_latest_activity_with_pagination(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "monitoring_case_list_pagination.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-monitor-token"
@@ -200,7 +186,7 @@ async def test_monitoring_case_list_orders_by_latest_activity_with_pagination(
     case_new = uuid4()
 
     now = datetime(2026, 2, 18, 12, 0, 0, tzinfo=UTC)
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -244,7 +230,7 @@ async def test_monitoring_case_list_orders_by_latest_activity_with_pagination(
             captured_at=now - timedelta(hours=1),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/monitoring/cases?page=1&page_size=2&from_date=2026-02-17&to_date=2026-02-18",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -261,8 +247,10 @@ async def test_monitoring_case_list_orders_by_latest_activity_with_pagination(
 
 
 @pytest.mark.asyncio
-async def test_monitoring_case_list_applies_status_and_period_filters(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "monitoring_case_list_filters.db")
+async def test_monitoring_case_list_applies_status_and_period_filters(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-filter-token"
@@ -270,7 +258,7 @@ async def test_monitoring_case_list_applies_status_and_period_filters(tmp_path:
     included_case = uuid4()
     excluded_status_case = uuid4()
     excluded_date_case = uuid4()
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -316,7 +304,7 @@ async def test_monitoring_case_list_applies_status_and_period_filters(tmp_path:
             captured_at=datetime(2026, 2, 17, 11, 0, 0, tzinfo=UTC),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             (
                 "/monitoring/cases?page=1&page_size=10"
@@ -335,9 +323,9 @@ async def test_monitoring_case_list_applies_status_and_period_filters(tmp_path:
 
 @pytest.mark.asyncio
 async def test_monitoring_case_list_defaults_to_today_filter_and_default_page_size(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "monitoring_case_list_defaults.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-defaults-token"
@@ -347,7 +335,7 @@ async def test_monitoring_case_list_defaults_to_today_filter_and_default_page_si
     now = datetime.now(tz=UTC)
     today = datetime(now.year, now.month, now.day, 9, 0, 0, tzinfo=UTC)
     yesterday = today - timedelta(days=1)
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -379,7 +367,7 @@ async def test_monitoring_case_list_defaults_to_today_filter_and_default_page_si
             captured_at=yesterday + timedelta(hours=2),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/monitoring/cases",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -1,24 +1,22 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
-from typing import Any, cast
-from uuid import UUID, uuid4
+from typing import Any
+from uuid import UUID
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from alembic import command
-from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.services.post_room2_widget_service import PostRoom2WidgetService
 from triage_automation.domain.case_status import CaseStatus
 from triage_automation.infrastructure.db.audit_repository import SqlAlchemyAuditRepository
 from triage_automation.infrastructure.db.case_repository import SqlAlchemyCaseRepository
 from triage_automation.infrastructure.db.message_repository import SqlAlchemyMessageRepository
+from triage_automation.infrastructure.db.metadata import cases
 from triage_automation.infrastructure.db.prior_case_queries import SqlAlchemyPriorCaseQueries
-from triage_automation.infrastructure.db.session import create_session_factory
 
 
 class FakeMatrixPoster:
@@ -80,18 +78,6 @@ class FakeMatrixPoster:
         return f"$room2-reply-file-{self._counter}"
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _structured_data(agency_record_number: str) -> dict[str, Any]:
     return {
         "schema_version": "1.1",
@@ -158,18 +144,14 @@ def _suggested_action(case_id: UUID, agency_record_number: str) -> dict[str, Any
     }
 
 
-def _extract_payload_from_widget_body(body: str) -> dict[str, Any]:
-    marker = "```json\n"
-    start = body.index(marker) + len(marker)
-    end = body.index("\n```", start)
-    parsed = json.loads(body[start:end])
-    return cast(dict[str, Any], parsed)
-
-
 @pytest.mark.asyncio
-async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "post_room2_widget.db")
-    session_factory = create_session_factory(async_url)
+async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(
+    sync_db_url: str,
+    async_db_url: str,
+    sync_engine_for: Callable[[str], sa.Engine],
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -177,62 +159,50 @@ async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_pat
     prior_queries = SqlAlchemyPriorCaseQueries(session_factory)
     matrix_poster = FakeMatrixPoster()
 
-    prior_case = await case_repo.create_case(
-        CaseCreateInput(
-            case_id=uuid4(),
-            status=CaseStatus.DOCTOR_DENIED,
-            room1_origin_room_id="!room1:example.org",
-            room1_origin_event_id="$origin-prior",
-            room1_sender_user_id="@human:example.org",
-        )
-    )
-    await case_repo.store_pdf_extraction(
-        case_id=prior_case.case_id,
-        pdf_mxc_url="mxc://example.org/prior",
-        extracted_text="prior text",
-        agency_record_number="12345",
-    )
-
-    now = datetime.now(tz=UTC)
-    engine = sa.create_engine(sync_url)
+    now = datetime(2026, 2, 16, 12, 0, tzinfo=UTC)
+    prior_case_id = UUID("11111111-1111-1111-1111-111111111111")
+    current_case_id = UUID("22222222-2222-2222-2222-222222222222")
+    engine = sync_engine_for(sync_db_url)
     with engine.begin() as connection:
         connection.execute(
-            sa.text(
-                "UPDATE cases SET created_at = :created_at, doctor_decision = 'deny', "
-                "doctor_reason = 'prior denial', doctor_decided_at = :decided_at "
-                "WHERE case_id = :case_id"
-            ),
-            {
-                "created_at": now - timedelta(days=2),
-                "decided_at": now - timedelta(days=2),
-                "case_id": prior_case.case_id.hex,
-            },
-        )
-
-    current_case = await case_repo.create_case(
-        CaseCreateInput(
-            case_id=uuid4(),
-            status=CaseStatus.LLM_SUGGEST,
-            room1_origin_room_id="!room1:example.org",
-            room1_origin_event_id="$origin-current",
-            room1_sender_user_id="@human:example.org",
+            sa.insert(cases),
+            [
+                {
+                    "case_id": prior_case_id,
+                    "status": CaseStatus.DOCTOR_DENIED.value,
+                    "room1_origin_room_id": "!room1:example.org",
+                    "room1_origin_event_id": "$origin-prior",
+                    "room1_sender_user_id": "@human:example.org",
+                    "created_at": now - timedelta(days=2),
+                    "pdf_mxc_url": "mxc://example.org/prior",
+                    "extracted_text": "prior text",
+                    "agency_record_number": "12345",
+                    "doctor_decision": "deny",
+                    "doctor_reason": "prior denial",
+                    "doctor_decided_at": now - timedelta(days=2),
+                    "structured_data_json": None,
+                    "summary_text": None,
+                    "suggested_action_json": None,
+                },
+                {
+                    "case_id": current_case_id,
+                    "status": CaseStatus.LLM_SUGGEST.value,
+                    "room1_origin_room_id": "!room1:example.org",
+                    "room1_origin_event_id": "$origin-current",
+                    "room1_sender_user_id": "@human:example.org",
+                    "created_at": now,
+                    "pdf_mxc_url": "mxc://example.org/current",
+                    "extracted_text": "current text",
+                    "agency_record_number": "12345",
+                    "doctor_decision": None,
+                    "doctor_reason": None,
+                    "doctor_decided_at": None,
+                    "structured_data_json": _structured_data("12345"),
+                    "summary_text": "Resumo LLM1",
+                    "suggested_action_json": _suggested_action(current_case_id, "12345"),
+                },
+            ],
         )
-    )
-    await case_repo.store_pdf_extraction(
-        case_id=current_case.case_id,
-        pdf_mxc_url="mxc://example.org/current",
-        extracted_text="current text",
-        agency_record_number="12345",
-    )
-    await case_repo.store_llm1_artifacts(
-        case_id=current_case.case_id,
-        structured_data_json=_structured_data("12345"),
-        summary_text="Resumo LLM1",
-    )
-    await case_repo.store_llm2_artifacts(
-        case_id=current_case.case_id,
-        suggested_action_json=_suggested_action(current_case.case_id, "12345"),
-    )
 
     service = PostRoom2WidgetService(
         room2_id="!room2:example.org",
@@ -242,9 +212,10 @@ async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_pat
         message_repository=message_repo,
         prior_case_queries=prior_queries,
         matrix_poster=matrix_poster,
+        now=lambda: now,
     )
 
-    await service.post_widget(case_id=current_case.case_id)
+    await service.post_widget(case_id=current_case_id)
 
     assert len(matrix_poster.send_calls) == 0
     assert len(matrix_poster.send_file_calls) == 1
@@ -254,7 +225,7 @@ async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_pat
         matrix_poster.send_file_calls[0]
     )
     assert root_room_id == "!room2:example.org"
-    assert root_filename == f"ocorrencia-12345-caso-{current_case.case_id}-relatorio-original.pdf"
+    assert root_filename == f"ocorrencia-12345-caso-{current_case_id}-relatorio-original.pdf"
     assert root_mxc_url == "mxc://example.org/current"
     assert root_mimetype == "application/pdf"
 
@@ -269,7 +240,7 @@ async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_pat
     assert summary_parent == root_event_id
     assert "no. ocorrência: 12345" in summary_body
     assert "paciente: Paciente" in summary_body
-    assert f"caso: {current_case.case_id}" not in summary_body
+    assert f"caso: {current_case_id}" not in summary_body
     assert "# Resumo técnico da triagem" in summary_body
     assert "## Resumo clínico:" in summary_body
     assert "## Achados críticos:" in summary_body
@@ -352,33 +323,28 @@ async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_pat
     assert template_formatted_body.endswith("</p>")
 
     with engine.begin() as connection:
-        status = connection.execute(
-            sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
-            {"case_id": current_case.case_id.hex},
-        ).scalar_one()
-        kinds = connection.execute(
-            sa.text(
-                "SELECT kind FROM case_messages "
-                "WHERE case_id = :case_id ORDER BY id"
-            ),
-            {"case_id": current_case.case_id.hex},
-        ).scalars().all()
-        status_event_payload = connection.execute(
+        status_and_kinds = connection.execute(
             sa.text(
-                "SELECT payload FROM case_events "
-                "WHERE case_id = :case_id AND event_type = 'CASE_STATUS_CHANGED' "
-                "ORDER BY id DESC LIMIT 1"
+                "SELECT c.status, m.kind FROM cases AS c "
+                "JOIN case_messages AS m ON m.case_id = c.case_id "
+                "WHERE c.case_id = :case_id ORDER BY m.id"
             ),
-            {"case_id": current_case.case_id.hex},
-        ).scalar_one()
-        widget_post_payload = connection.execute(
-            sa.text(
-                "SELECT payload FROM case_events "
-                "WHERE case_id = :case_id AND event_type = 'ROOM2_WIDGET_POSTED' "
-                "ORDER BY id DESC LIMIT 1"
-            ),
-            {"case_id": current_case.case_id.hex},
-        ).scalar_one()
+            {"case_id": current_case_id.hex},
+        ).all()
+        event_payloads = {
+            row.event_type: row.payload
+            for row in connection.execute(
+                sa.text(
+                    "SELECT event_type, payload FROM case_events "
+                    "WHERE case_id = :case_id "
+                    "AND event_type IN ("
+                    "'PRIOR_CASE_LOOKUP_COMPLETED', 'CASE_STATUS_CHANGED', 'ROOM2_WIDGET_POSTED'"
+                    ") "
+                    "ORDER BY id"
+                ),
+                {"case_id": current_case_id.hex},
+            )
+        }
         root_case_id = connection.execute(
             sa.text(
                 "SELECT case_id FROM case_messages "
@@ -394,18 +360,21 @@ async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_pat
                 "WHERE case_id = :case_id "
                 "ORDER BY id"
             ),
-            {"case_id": current_case.case_id.hex},
+            {"case_id": current_case_id.hex},
         ).mappings().all()
 
-    assert status == "WAIT_DOCTOR"
-    assert list(kinds) == [
+    status_event_payload = event_payloads["CASE_STATUS_CHANGED"]
+    widget_post_payload = event_payloads["ROOM2_WIDGET_POSTED"]
+    prior_lookup_payload = event_payloads["PRIOR_CASE_LOOKUP_COMPLETED"]
+    assert {row.status for row in status_and_kinds} == {"WAIT_DOCTOR"}
+    assert [row.kind for row in status_and_kinds] == [
         "room2_case_root",
         "room2_case_summary",
         "room2_case_instructions",
         "room2_case_template",
     ]
     assert root_case_id is not None
-    assert UUID(str(root_case_id)) == current_case.case_id
+    assert UUID(str(root_case_id)) == current_case_id
     assert len(transcript_rows) == 4
     assert transcript_rows[0]["message_type"] == "room2_case_root"
     assert transcript_rows[0]["sender"] == "bot"
@@ -435,3 +404,10 @@ async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_pat
         else json.loads(widget_post_payload)
     )
     assert parsed_widget_payload["patient_name"] == "Paciente"
+    parsed_prior_lookup_payload = (
+        prior_lookup_payload
+        if isinstance(prior_lookup_payload, dict)
+        else json.loads(prior_lookup_payload)
+    )
+    assert parsed_prior_lookup_payload["prior_case_found"] is True
+    assert parsed_prior_lookup_payload["prior_case_id"] == str(prior_case_id)
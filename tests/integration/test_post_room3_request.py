@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.services.post_room3_request_service import (
     PostRoom3RequestService,
@@ -36,22 +33,12 @@ class FakeMatrixPoster:
         return f"$room3-{self._counter}"
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 @pytest.mark.asyncio
-async def test_room3_request_posts_request_and_template_and_moves_wait_appt(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room3_request_ok.db")
-    session_factory = create_session_factory(async_url)
+async def test_room3_request_posts_request_and_template_and_moves_wait_appt(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -118,7 +105,7 @@ async def test_room3_request_posts_request_and_template_and_moves_wait_appt(tmp_
     assert "data_hora: DD-MM-YYYY HH:MM BRT" in template_body
     assert f"caso: {case.case_id}" in template_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         status = connection.execute(
             sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
@@ -155,9 +142,11 @@ async def test_room3_request_posts_request_and_template_and_moves_wait_appt(tmp_
 
 
 @pytest.mark.asyncio
-async def test_duplicate_job_execution_is_idempotent(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room3_request_idempotent.db")
-    session_factory = create_session_factory(async_url)
+async def test_duplicate_job_execution_is_idempotent(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -190,7 +179,7 @@ async def test_duplicate_job_execution_is_idempotent(tmp_path: Path) -> None:
     assert len(matrix_poster.send_calls) == 1
     assert len(matrix_poster.reply_calls) == 1
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         message_count = connection.execute(
             sa.text("SELECT COUNT(*) FROM case_messages WHERE case_id = :case_id"),
@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.services.process_pdf_case_service import (
     ProcessPdfCaseRetriableError,
@@ -66,22 +63,12 @@ def _build_simple_pdf(text: str) -> bytes:
     return b"".join(parts)
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 @pytest.mark.asyncio
-async def test_download_extract_updates_case_status_and_text(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "process_ok.db")
-    session_factory = create_session_factory(async_url)
+async def test_download_extract_updates_case_status_and_text(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
 
     case = await case_repo.create_case(
@@ -106,11 +93,14 @@ async def test_download_extract_updates_case_status_and_text(tmp_path: Path) ->
         text_extractor=PdfTextExtractor(),
     )
 
-    extracted = await service.process_case(case_id=case.case_id, pdf_mxc_url="mxc://example.org/pdf")
+    extracted = await service.process_case(
+        case_id=case.case_id,
+        pdf_mxc_url="mxc://example.org/pdf",
+    )
 
     assert extracted == "RELATORIO DE OCORRENCIAS Clinical text"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         row = connection.execute(
             sa.text(
@@ -125,9 +115,11 @@ async def test_download_extract_updates_case_status_and_text(tmp_path: Path) ->
 
 
 @pytest.mark.asyncio
-async def test_download_failure_maps_to_retriable_download_error(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "process_download_fail.db")
-    session_factory = create_session_factory(async_url)
+async def test_download_failure_maps_to_retriable_download_error(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
 
     case = await case_repo.create_case(
@@ -151,7 +143,7 @@ async def test_download_failure_maps_to_retriable_download_error(tmp_path: Path)
 
     assert exc_info.value.cause == "download"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         status = connection.execute(
             sa.text("SELECT status FROM cases ORDER BY created_at DESC LIMIT 1"),
@@ -161,9 +153,11 @@ async def test_download_failure_maps_to_retriable_download_error(tmp_path: Path)
 
 
 @pytest.mark.asyncio
-async def test_extraction_failure_maps_to_retriable_extract_error(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "process_extract_fail.db")
-    session_factory = create_session_factory(async_url)
+async def test_extraction_failure_maps_to_retriable_extract_error(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
 
     case = await case_repo.create_case(
@@ -187,7 +181,7 @@ async def test_extraction_failure_maps_to_retriable_extract_error(tmp_path: Path
 
     assert exc_info.value.cause == "extract"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         status = connection.execute(
             sa.text("SELECT status FROM cases ORDER BY created_at DESC LIMIT 1"),
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.services.llm1_service import Llm1Service
 from triage_automation.application.services.process_pdf_case_service import (
@@ -72,18 +69,6 @@ def _build_simple_pdf(text: str) -> bytes:
     return b"".join(parts)
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _valid_llm1_payload(agency_record_number: str) -> dict[str, object]:
     return {
         "schema_version": "1.1",
@@ -123,9 +108,11 @@ def _valid_llm1_payload(agency_record_number: str) -> dict[str, object]:
 
 
 @pytest.mark.asyncio
-async def test_valid_llm1_response_persists_structured_data_and_summary(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "llm1_ok.db")
-    session_factory = create_session_factory(async_url)
+async def test_valid_llm1_response_persists_structured_data_and_summary(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
 
     case = await case_repo.create_case(
@@ -158,7 +145,7 @@ async def test_valid_llm1_response_persists_structured_data_and_summary(tmp_path
 
     assert cleaned == "RELATORIO DE OCORRENCIAS clinical text"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         row = connection.execute(
             sa.text(
@@ -173,9 +160,10 @@ async def test_valid_llm1_response_persists_structured_data_and_summary(tmp_path
 
 
 @pytest.mark.asyncio
-async def test_invalid_llm1_schema_maps_to_retriable_llm1_error(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "llm1_schema_fail.db")
-    session_factory = create_session_factory(async_url)
+async def test_invalid_llm1_schema_maps_to_retriable_llm1_error(
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
 
     case = await case_repo.create_case(
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.services.llm1_service import Llm1Service
 from triage_automation.application.services.llm2_service import Llm2Service
@@ -101,18 +98,6 @@ def _build_simple_pdf(text: str) -> bytes:
     return b"".join(parts)
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _valid_llm1_payload(agency_record_number: str) -> dict[str, object]:
     return {
         "schema_version": "1.1",
@@ -189,9 +174,11 @@ def _decode_json(value: Any) -> dict[str, Any]:
 
 
 @pytest.mark.asyncio
-async def test_llm2_persists_suggestion_and_enqueues_room2_widget_job(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "llm2_ok.db")
-    session_factory = create_session_factory(async_url)
+async def test_llm2_persists_suggestion_and_enqueues_room2_widget_job(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     queue_repo = SqlAlchemyJobQueueRepository(session_factory)
@@ -230,7 +217,7 @@ async def test_llm2_persists_suggestion_and_enqueues_room2_widget_job(tmp_path:
 
     await service.process_case(case_id=case.case_id, pdf_mxc_url="mxc://example.org/pdf")
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         row = connection.execute(
             sa.text(
@@ -291,9 +278,11 @@ async def test_llm2_persists_suggestion_and_enqueues_room2_widget_job(tmp_path:
 
 
 @pytest.mark.asyncio
-async def test_llm2_contradiction_emits_audit_event_and_forces_deny(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "llm2_contradiction.db")
-    session_factory = create_session_factory(async_url)
+async def test_llm2_contradiction_emits_audit_event_and_forces_deny(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     queue_repo = SqlAlchemyJobQueueRepository(session_factory)
@@ -353,7 +342,7 @@ async def test_llm2_contradiction_emits_audit_event_and_forces_deny(tmp_path: Pa
 
     await service.process_case(case_id=case.case_id, pdf_mxc_url="mxc://example.org/pdf")
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         row = connection.execute(
             sa.text("SELECT suggested_action_json FROM cases ORDER BY created_at DESC LIMIT 1")
@@ -374,10 +363,10 @@ async def test_llm2_contradiction_emits_audit_event_and_forces_deny(tmp_path: Pa
 
 @pytest.mark.asyncio
 async def test_runtime_provider_adapter_preserves_llm2_retriable_mapping(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "llm2_provider_non_json.db")
-    session_factory = create_session_factory(async_url)
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     queue_repo = SqlAlchemyJobQueueRepository(session_factory)
@@ -432,7 +421,7 @@ async def test_runtime_provider_adapter_preserves_llm2_retriable_mapping(
     with pytest.raises(ProcessPdfCaseRetriableError) as error_info:
         await service.process_case(case_id=case.case_id, pdf_mxc_url="mxc://example.org/pdf")
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         interaction_rows = connection.execute(
             sa.text(
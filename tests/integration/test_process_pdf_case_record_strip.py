@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.services.process_pdf_case_service import ProcessPdfCaseService
 from triage_automation.domain.case_status import CaseStatus
@@ -60,22 +57,12 @@ def _build_simple_pdf(text: str) -> bytes:
     return b"".join(parts)
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 @pytest.mark.asyncio
-async def test_record_number_persisted_and_stripped_from_text(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "record_strip_ok.db")
-    session_factory = create_session_factory(async_url)
+async def test_record_number_persisted_and_stripped_from_text(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
 
     case = await case_repo.create_case(
@@ -101,7 +88,7 @@ async def test_record_number_persisted_and_stripped_from_text(tmp_path: Path) ->
 
     assert cleaned == "RELATORIO DE OCORRENCIAS patient data details 99999"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         row = connection.execute(
             sa.text(
@@ -127,9 +114,11 @@ async def test_record_number_persisted_and_stripped_from_text(tmp_path: Path) ->
 
 
 @pytest.mark.asyncio
-async def test_missing_record_number_falls_back_to_epoch_millis(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "record_strip_fallback.db")
-    session_factory = create_session_factory(async_url)
+async def test_missing_record_number_falls_back_to_epoch_millis(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
 
     case = await case_repo.create_case(
@@ -154,7 +143,7 @@ async def test_missing_record_number_falls_back_to_epoch_millis(tmp_path: Path)
 
     assert cleaned == "no token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         row = connection.execute(
             sa.text(
@@ -3,15 +3,12 @@ from __future__ import annotations
 import json
 import re
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 from fastapi.testclient import TestClient
 
-from alembic import command
 from apps.bot_api.main import create_app
 from triage_automation.application.services.auth_service import AuthService
 from triage_automation.infrastructure.db.auth_event_repository import SqlAlchemyAuthEventRepository
@@ -22,17 +19,6 @@ from triage_automation.infrastructure.security.password_hasher import BcryptPass
 from triage_automation.infrastructure.security.token_service import OpaqueTokenService
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-    return sync_url, async_url
-
-
 def _insert_user(
     connection: sa.Connection,
     *,
@@ -119,13 +105,15 @@ def _build_client(async_url: str, *, token_service: OpaqueTokenService) -> TestC
 
 
 @pytest.mark.asyncio
-async def test_admin_lists_prompt_versions_with_active_flags(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_admin_list_versions.db")
+async def test_admin_lists_prompt_versions_with_active_flags(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-prompt-list-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -142,7 +130,7 @@ async def test_admin_lists_prompt_versions_with_active_flags(tmp_path: Path) ->
             is_active=False,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/admin/prompts/versions",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -155,13 +143,15 @@ async def test_admin_lists_prompt_versions_with_active_flags(tmp_path: Path) ->
 
 
 @pytest.mark.asyncio
-async def test_admin_gets_active_prompt_version_by_name(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_admin_get_active.db")
+async def test_admin_gets_active_prompt_version_by_name(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-prompt-active-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -171,7 +161,7 @@ async def test_admin_gets_active_prompt_version_by_name(tmp_path: Path) -> None:
             token=admin_token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/admin/prompts/llm1_system/active",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -182,13 +172,12 @@ async def test_admin_gets_active_prompt_version_by_name(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_admin_activates_prompt_version(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_admin_activate.db")
+async def test_admin_activates_prompt_version(sync_db_url: str, async_db_url: str) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-prompt-activate-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -205,7 +194,7 @@ async def test_admin_activates_prompt_version(tmp_path: Path) -> None:
             is_active=False,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/admin/prompts/llm2_system/activate",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -215,7 +204,7 @@ async def test_admin_activates_prompt_version(tmp_path: Path) -> None:
     assert response.status_code == 200
     assert response.json() == {"name": "llm2_system", "version": 4, "is_active": True}
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         rows = connection.execute(
             sa.text(
                 "SELECT version, is_active FROM prompt_templates "
@@ -232,14 +221,14 @@ async def test_admin_activates_prompt_version(tmp_path: Path) -> None:
 
 @pytest.mark.asyncio
 async def test_reader_cannot_activate_prompt_version_and_state_remains_unchanged(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_reader_rejected.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-prompt-activate-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -256,7 +245,7 @@ async def test_reader_cannot_activate_prompt_version_and_state_remains_unchanged
             is_active=False,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/admin/prompts/llm2_user/activate",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -266,7 +255,7 @@ async def test_reader_cannot_activate_prompt_version_and_state_remains_unchanged
     assert response.status_code == 403
     assert response.json() == {"detail": "admin role required"}
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         rows = connection.execute(
             sa.text(
                 "SELECT version, is_active FROM prompt_templates "
@@ -282,13 +271,15 @@ async def test_reader_cannot_activate_prompt_version_and_state_remains_unchanged
 
 
 @pytest.mark.asyncio
-async def test_admin_renders_prompt_management_html_page_with_versions(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_admin_html_page.db")
+async def test_admin_renders_prompt_management_html_page_with_versions(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-prompt-html-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -305,7 +296,7 @@ async def test_admin_renders_prompt_management_html_page_with_versions(tmp_path:
             is_active=False,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/admin/prompts",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -327,13 +318,15 @@ async def test_admin_renders_prompt_management_html_page_with_versions(tmp_path:
 
 
 @pytest.mark.asyncio
-async def test_admin_renders_prompt_version_content_page(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_admin_version_content.db")
+async def test_admin_renders_prompt_version_content_page(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-prompt-version-content-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -350,7 +343,7 @@ async def test_admin_renders_prompt_version_content_page(tmp_path: Path) -> None
             is_active=False,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/admin/prompts/llm1_user/versions/4",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -365,13 +358,15 @@ async def test_admin_renders_prompt_version_content_page(tmp_path: Path) -> None
 
 
 @pytest.mark.asyncio
-async def test_admin_create_form_inserts_new_prompt_version_and_audits(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_admin_create_form.db")
+async def test_admin_create_form_inserts_new_prompt_version_and_audits(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-prompt-create-form-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -381,7 +376,7 @@ async def test_admin_create_form_inserts_new_prompt_version_and_audits(tmp_path:
             token=admin_token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/admin/prompts/llm2_user/create-form",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -397,7 +392,7 @@ async def test_admin_create_form_inserts_new_prompt_version_and_audits(tmp_path:
     assert "created_name=llm2_user" in response.headers["location"]
     assert "created_version=4" in response.headers["location"]
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         versions_rows = connection.execute(
             sa.text(
                 "SELECT version, is_active, content FROM prompt_templates "
@@ -442,14 +437,14 @@ async def test_admin_create_form_inserts_new_prompt_version_and_audits(tmp_path:
 
 @pytest.mark.asyncio
 async def test_admin_prompt_page_shows_recent_versions_with_active_visible_and_toggle(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_admin_recent_toggle.db")
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-prompt-recent-toggle-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -467,7 +462,7 @@ async def test_admin_prompt_page_shows_recent_versions_with_active_visible_and_t
                 is_active=version == 2,
             )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/admin/prompts",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -487,13 +482,15 @@ async def test_admin_prompt_page_shows_recent_versions_with_active_visible_and_t
 
 
 @pytest.mark.asyncio
-async def test_admin_activation_form_updates_prompt_version_and_redirects(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_admin_html_activate.db")
+async def test_admin_activation_form_updates_prompt_version_and_redirects(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-prompt-html-activate-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -510,7 +507,7 @@ async def test_admin_activation_form_updates_prompt_version_and_redirects(tmp_pa
             is_active=False,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/admin/prompts/llm2_system/activate-form",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -523,7 +520,7 @@ async def test_admin_activation_form_updates_prompt_version_and_redirects(tmp_pa
     assert "activated_name=llm2_system" in response.headers["location"]
     assert "activated_version=4" in response.headers["location"]
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         rows = connection.execute(
             sa.text(
                 "SELECT version, is_active FROM prompt_templates "
@@ -540,14 +537,14 @@ async def test_admin_activation_form_updates_prompt_version_and_redirects(tmp_pa
 
 @pytest.mark.asyncio
 async def test_reader_prompt_management_html_is_forbidden_and_does_not_mutate_state(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_reader_html_forbidden.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-prompt-html-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -564,7 +561,7 @@ async def test_reader_prompt_management_html_is_forbidden_and_does_not_mutate_st
             is_active=False,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         page_response = client.get(
             "/admin/prompts",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -580,7 +577,7 @@ async def test_reader_prompt_management_html_is_forbidden_and_does_not_mutate_st
     assert activate_response.status_code == 403
     assert activate_response.json() == {"detail": "admin role required"}
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         rows = connection.execute(
             sa.text(
                 "SELECT version, is_active FROM prompt_templates "
@@ -597,16 +594,16 @@ async def test_reader_prompt_management_html_is_forbidden_and_does_not_mutate_st
 
 @pytest.mark.asyncio
 async def test_authorization_matrix_reader_read_only_and_admin_prompt_mutation(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_authz_matrix.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-authz-matrix-token"
     admin_id = uuid4()
     admin_token = "admin-authz-matrix-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -630,7 +627,7 @@ async def test_authorization_matrix_reader_read_only_and_admin_prompt_mutation(
             is_active=False,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         reader_monitoring = client.get(
             "/monitoring/cases",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -661,7 +658,7 @@ async def test_authorization_matrix_reader_read_only_and_admin_prompt_mutation(
     assert admin_activate.status_code == 200
     assert admin_activate.json() == {"name": "llm2_system", "version": 4, "is_active": True}
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         rows = connection.execute(
             sa.text(
                 "SELECT version, is_active FROM prompt_templates "
@@ -677,13 +674,15 @@ async def test_authorization_matrix_reader_read_only_and_admin_prompt_mutation(
 
 
 @pytest.mark.asyncio
-async def test_admin_activation_appends_prompt_audit_event(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_admin_audit.db")
+async def test_admin_activation_appends_prompt_audit_event(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-prompt-audit-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -700,7 +699,7 @@ async def test_admin_activation_appends_prompt_audit_event(tmp_path: Path) -> No
             is_active=False,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/admin/prompts/llm1_user/activate",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -709,7 +708,7 @@ async def test_admin_activation_appends_prompt_audit_event(tmp_path: Path) -> No
 
     assert response.status_code == 200
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         event_row = connection.execute(
             sa.text(
                 "SELECT user_id, event_type, payload, occurred_at "
@@ -733,13 +732,15 @@ async def test_admin_activation_appends_prompt_audit_event(tmp_path: Path) -> No
 
 
 @pytest.mark.asyncio
-async def test_admin_form_activation_appends_prompt_audit_event(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_management_admin_form_audit.db")
+async def test_admin_form_activation_appends_prompt_audit_event(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-prompt-form-audit-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -756,7 +757,7 @@ async def test_admin_form_activation_appends_prompt_audit_event(tmp_path: Path)
             is_active=False,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/admin/prompts/llm2_user/activate-form",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -766,7 +767,7 @@ async def test_admin_form_activation_appends_prompt_audit_event(tmp_path: Path)
 
     assert response.status_code == 303
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         event_row = connection.execute(
             sa.text(
                 "SELECT user_id, event_type, payload, occurred_at "
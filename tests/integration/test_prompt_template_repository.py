@@ -1,35 +1,21 @@
 from __future__ import annotations
 
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.infrastructure.db.prompt_template_repository import (
     SqlAlchemyPromptTemplateRepository,
 )
 from triage_automation.infrastructure.db.session import create_session_factory
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 @pytest.mark.asyncio
-async def test_repository_returns_seeded_active_prompt(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "prompt_repo_seeded.db")
-    session_factory = create_session_factory(async_url)
+async def test_repository_returns_seeded_active_prompt(
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     repo = SqlAlchemyPromptTemplateRepository(session_factory)
 
     prompt = await repo.get_active_by_name(name="llm1_system")
@@ -41,9 +27,10 @@ async def test_repository_returns_seeded_active_prompt(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_repository_returns_none_when_no_active_prompt_exists(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "prompt_repo_missing.db")
-    session_factory = create_session_factory(async_url)
+async def test_repository_returns_none_when_no_active_prompt_exists(
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     repo = SqlAlchemyPromptTemplateRepository(session_factory)
 
     prompt = await repo.get_active_by_name(name="missing_prompt_name")
@@ -52,12 +39,14 @@ async def test_repository_returns_none_when_no_active_prompt_exists(tmp_path: Pa
 
 
 @pytest.mark.asyncio
-async def test_repository_resolves_only_active_version_for_same_name(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "prompt_repo_versions.db")
-    session_factory = create_session_factory(async_url)
+async def test_repository_resolves_only_active_version_for_same_name(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     repo = SqlAlchemyPromptTemplateRepository(session_factory)
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         connection.execute(
             sa.text(
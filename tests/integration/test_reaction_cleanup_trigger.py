@@ -1,14 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from apps.bot_matrix.main import poll_reaction_events_once
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.ports.message_repository_port import CaseMessageCreateInput
@@ -37,18 +34,6 @@ class _FakeSyncClient:
         return self._sync_payload
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _reaction_event(
     *,
     event_id: str,
@@ -116,9 +101,11 @@ def _insert_reaction_checkpoint(
 
 
 @pytest.mark.asyncio
-async def test_concurrent_room1_thumbs_up_triggers_cleanup_once(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "reaction_room1_race.db")
-    session_factory = create_session_factory(async_url)
+async def test_concurrent_room1_thumbs_up_triggers_cleanup_once(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -135,7 +122,7 @@ async def test_concurrent_room1_thumbs_up_triggers_cleanup_once(tmp_path: Path)
         )
     )
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         connection.execute(
             sa.text(
@@ -225,9 +212,11 @@ async def test_concurrent_room1_thumbs_up_triggers_cleanup_once(tmp_path: Path)
 
 
 @pytest.mark.asyncio
-async def test_room2_and_room3_ack_thumbs_are_audit_only(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "reaction_room2_room3_audit.db")
-    session_factory = create_session_factory(async_url)
+async def test_room2_and_room3_ack_thumbs_are_audit_only(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -262,7 +251,7 @@ async def test_room2_and_room3_ack_thumbs_are_audit_only(tmp_path: Path) -> None
             kind="bot_ack",
         )
     )
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_reaction_checkpoint(
             connection,
@@ -359,9 +348,11 @@ async def test_room2_and_room3_ack_thumbs_are_audit_only(tmp_path: Path) -> None
 
 
 @pytest.mark.asyncio
-async def test_room1_checkmark_with_variation_triggers_cleanup_once(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "reaction_room1_checkmark.db")
-    session_factory = create_session_factory(async_url)
+async def test_room1_checkmark_with_variation_triggers_cleanup_once(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -378,7 +369,7 @@ async def test_room1_checkmark_with_variation_triggers_cleanup_once(tmp_path: Pa
         )
     )
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         connection.execute(
             sa.text(
@@ -448,9 +439,11 @@ async def test_room1_checkmark_with_variation_triggers_cleanup_once(tmp_path: Pa
 
 
 @pytest.mark.asyncio
-async def test_room2_room3_ack_accept_checkmark_and_thumbs_variants(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "reaction_room23_variants.db")
-    session_factory = create_session_factory(async_url)
+async def test_room2_room3_ack_accept_checkmark_and_thumbs_variants(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -519,7 +512,7 @@ async def test_room2_room3_ack_accept_checkmark_and_thumbs_variants(tmp_path: Pa
     assert room2_result.processed is True
     assert room3_result.processed is True
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         cleanup_job_count = connection.execute(
             sa.text(
@@ -549,9 +542,11 @@ async def test_room2_room3_ack_accept_checkmark_and_thumbs_variants(tmp_path: Pa
 
 
 @pytest.mark.asyncio
-async def test_runtime_listener_routes_room1_thumbs_to_cleanup_trigger_path(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "reaction_listener_room1.db")
-    session_factory = create_session_factory(async_url)
+async def test_runtime_listener_routes_room1_thumbs_to_cleanup_trigger_path(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -568,7 +563,7 @@ async def test_runtime_listener_routes_room1_thumbs_to_cleanup_trigger_path(tmp_
         )
     )
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         connection.execute(
             sa.text(
@@ -638,9 +633,11 @@ async def test_runtime_listener_routes_room1_thumbs_to_cleanup_trigger_path(tmp_
 
 
 @pytest.mark.asyncio
-async def test_runtime_listener_routes_room2_room3_thumbs_as_audit_only(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "reaction_listener_room2_room3.db")
-    session_factory = create_session_factory(async_url)
+async def test_runtime_listener_routes_room2_room3_thumbs_as_audit_only(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -675,7 +672,7 @@ async def test_runtime_listener_routes_room2_room3_thumbs_as_audit_only(tmp_path
             kind="bot_ack",
         )
     )
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_reaction_checkpoint(
             connection,
@@ -789,9 +786,11 @@ async def test_runtime_listener_routes_room2_room3_thumbs_as_audit_only(tmp_path
 
 
 @pytest.mark.asyncio
-async def test_room2_non_positive_reaction_is_ignored(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "reaction_room2_non_positive.db")
-    session_factory = create_session_factory(async_url)
+async def test_room2_non_positive_reaction_is_ignored(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -817,7 +816,7 @@ async def test_room2_non_positive_reaction_is_ignored(tmp_path: Path) -> None:
             kind="room2_decision_ack",
         )
     )
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_reaction_checkpoint(
             connection,
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.services.post_room1_final_service import (
     PostRoom1FinalService,
@@ -34,18 +31,6 @@ class FakeMatrixPoster:
         return f"$room1-final-{self._counter}"
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 async def _create_case(
     case_repo: SqlAlchemyCaseRepository,
     *,
@@ -90,9 +75,11 @@ async def _store_case_context(
 
 
 @pytest.mark.asyncio
-async def test_final_replies_match_templates_and_reply_to_origin(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room1_final_variants.db")
-    session_factory = create_session_factory(async_url)
+async def test_final_replies_match_templates_and_reply_to_origin(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     audit_repo = SqlAlchemyAuditRepository(session_factory)
@@ -160,7 +147,7 @@ async def test_final_replies_match_templates_and_reply_to_origin(tmp_path: Path)
         requested_exam="EDA",
     )
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         connection.execute(
             sa.text(
@@ -1,13 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-from pathlib import Path
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from triage_automation.application.services.room1_intake_service import Room1IntakeService
 from triage_automation.infrastructure.db.audit_repository import SqlAlchemyAuditRepository
 from triage_automation.infrastructure.db.case_repository import SqlAlchemyCaseRepository
@@ -28,18 +25,6 @@ class FakeMatrixPoster:
         return f"$processing-{self._counter}"
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _make_raw_pdf_event(event_id: str) -> dict[str, object]:
     return {
         "event_id": event_id,
@@ -54,9 +39,11 @@ def _make_raw_pdf_event(event_id: str) -> dict[str, object]:
 
 
 @pytest.mark.asyncio
-async def test_valid_pdf_creates_case_and_enqueues_job(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "intake_valid.db")
-    session_factory = create_session_factory(async_url)
+async def test_valid_pdf_creates_case_and_enqueues_job(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     matrix_poster = FakeMatrixPoster()
 
     service = Room1IntakeService(
@@ -80,7 +67,7 @@ async def test_valid_pdf_creates_case_and_enqueues_job(tmp_path: Path) -> None:
     assert result.case_id is not None
     assert matrix_poster.calls == [("!room1:example.org", "$origin-1", "processando...")]
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_count = connection.execute(sa.text("SELECT COUNT(*) FROM cases")).scalar_one()
         job_count = connection.execute(
@@ -112,9 +99,11 @@ async def test_valid_pdf_creates_case_and_enqueues_job(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_duplicate_intake_event_is_ignored(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "intake_duplicate.db")
-    session_factory = create_session_factory(async_url)
+async def test_duplicate_intake_event_is_ignored(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     matrix_poster = FakeMatrixPoster()
 
     service = Room1IntakeService(
@@ -139,7 +128,7 @@ async def test_duplicate_intake_event_is_ignored(tmp_path: Path) -> None:
     assert second.processed is False
     assert second.reason == "duplicate_origin_event"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_count = connection.execute(sa.text("SELECT COUNT(*) FROM cases")).scalar_one()
         job_count = connection.execute(sa.text("SELECT COUNT(*) FROM jobs")).scalar_one()
@@ -150,9 +139,11 @@ async def test_duplicate_intake_event_is_ignored(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_concurrent_same_event_creates_single_case(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "intake_race.db")
-    session_factory = create_session_factory(async_url)
+async def test_concurrent_same_event_creates_single_case(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    session_factory = create_session_factory(async_db_url)
     matrix_poster = FakeMatrixPoster()
 
     service = Room1IntakeService(
@@ -177,7 +168,7 @@ async def test_concurrent_same_event_creates_single_case(tmp_path: Path) -> None
 
     assert {first.processed, second.processed} == {True, False}
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_count = connection.execute(sa.text("SELECT COUNT(*) FROM cases")).scalar_one()
         job_count = connection.execute(sa.text("SELECT COUNT(*) FROM jobs")).scalar_one()
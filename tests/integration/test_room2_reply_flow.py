@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from pathlib import Path
+from collections.abc import Callable
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from alembic import command
 from apps.bot_matrix.main import poll_room2_reply_events_once
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.ports.message_repository_port import CaseMessageCreateInput
@@ -23,7 +22,6 @@ from triage_automation.infrastructure.db.message_repository import SqlAlchemyMes
 from triage_automation.infrastructure.db.reaction_checkpoint_repository import (
     SqlAlchemyReactionCheckpointRepository,
 )
-from triage_automation.infrastructure.db.session import create_session_factory
 
 
 class FakeMatrixRuntimeClient:
@@ -60,37 +58,24 @@ class FakeMatrixRuntimeClient:
         return user_id in self._joined_members.get(room_id, set())
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 async def _setup_wait_doctor_case(
-    async_url: str,
+    session_factory: async_sessionmaker[AsyncSession],
     *,
     origin_event_id: str,
 ) -> tuple[UUID, str]:
     return await _setup_case_with_status(
-        async_url,
+        session_factory,
         origin_event_id=origin_event_id,
         status=CaseStatus.WAIT_DOCTOR,
     )
 
 
 async def _setup_case_with_status(
-    async_url: str,
+    session_factory: async_sessionmaker[AsyncSession],
     *,
     origin_event_id: str,
     status: CaseStatus,
 ) -> tuple[UUID, str]:
-    session_factory = create_session_factory(async_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
     message_repo = SqlAlchemyMessageRepository(session_factory)
 
@@ -183,11 +168,12 @@ def _sync_payload(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_routes_room2_decision_reply_to_existing_decision_path(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_valid.db")
     case_id, root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-valid",
     )
     body = (
@@ -212,7 +198,7 @@ async def test_runtime_listener_routes_room2_decision_reply_to_existing_decision
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -251,7 +237,7 @@ async def test_runtime_listener_routes_room2_decision_reply_to_existing_decision
     assert "decisao: aceitar" in ack_body
     assert "suporte: nenhum" in ack_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -327,13 +313,14 @@ async def test_runtime_listener_routes_room2_decision_reply_to_existing_decision
     ],
 )
 async def test_runtime_listener_accepts_all_supported_room2_support_flags(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
     support_line: str,
     expected_support_flag: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_support_flags.db")
     case_id, root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-support-flags",
     )
     body = (
@@ -357,7 +344,7 @@ async def test_runtime_listener_accepts_all_supported_room2_support_flags(
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -392,7 +379,7 @@ async def test_runtime_listener_accepts_all_supported_room2_support_flags(
     assert "paciente: não detectado" in ack_body
     assert f"caso: {case_id}" not in ack_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -417,15 +404,16 @@ async def test_runtime_listener_accepts_all_supported_room2_support_flags(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_routes_room2_decision_reply_to_instructions_message(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_instructions.db")
     case_id, _root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-instructions",
     )
     instructions_event_id = "$room2-instructions"
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     await message_repository.add_message(
         CaseMessageCreateInput(
@@ -493,7 +481,7 @@ async def test_runtime_listener_routes_room2_decision_reply_to_instructions_mess
     assert "decisao: aceitar" in ack_body
     assert "suporte: nenhum" in ack_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -518,15 +506,16 @@ async def test_runtime_listener_routes_room2_decision_reply_to_instructions_mess
 
 @pytest.mark.asyncio
 async def test_runtime_listener_routes_room2_decision_reply_to_template_message(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_template.db")
     case_id, _root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-template",
     )
     template_event_id = "$room2-template"
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     await message_repository.add_message(
         CaseMessageCreateInput(
@@ -594,7 +583,7 @@ async def test_runtime_listener_routes_room2_decision_reply_to_template_message(
     assert "decisao: aceitar" in ack_body
     assert "suporte: nenhum" in ack_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -619,11 +608,12 @@ async def test_runtime_listener_routes_room2_decision_reply_to_template_message(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_routes_room2_deny_reply_to_denial_job_path(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_deny.db")
     case_id, root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-deny",
     )
     body = (
@@ -647,7 +637,7 @@ async def test_runtime_listener_routes_room2_deny_reply_to_denial_job_path(
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -681,7 +671,7 @@ async def test_runtime_listener_routes_room2_deny_reply_to_denial_job_path(
     assert "decisao: negar" in ack_body
     assert "suporte: nenhum" in ack_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -706,11 +696,12 @@ async def test_runtime_listener_routes_room2_deny_reply_to_denial_job_path(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_rejects_deny_with_non_none_support_flag(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_invalid_deny_support.db")
     case_id, root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-invalid-deny-support",
     )
     body = (
@@ -734,7 +725,7 @@ async def test_runtime_listener_rejects_deny_with_non_none_support_flag(
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -768,7 +759,7 @@ async def test_runtime_listener_rejects_deny_with_non_none_support_flag(
     assert "codigo_erro: invalid_template" in error_body
     assert f"caso: {case_id}" in error_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -791,11 +782,12 @@ async def test_runtime_listener_rejects_deny_with_non_none_support_flag(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_duplicate_room2_replies_are_idempotent(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_duplicate.db")
     case_id, root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-duplicate",
     )
     body = (
@@ -825,7 +817,7 @@ async def test_runtime_listener_duplicate_room2_replies_are_idempotent(
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -860,7 +852,7 @@ async def test_runtime_listener_duplicate_room2_replies_are_idempotent(
     assert "resultado: erro" in second_feedback
     assert "codigo_erro: state_conflict" in second_feedback
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -883,11 +875,12 @@ async def test_runtime_listener_duplicate_room2_replies_are_idempotent(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_duplicate_room2_deny_replies_are_idempotent(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_duplicate_deny.db")
     case_id, root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-duplicate-deny",
     )
     body = (
@@ -917,7 +910,7 @@ async def test_runtime_listener_duplicate_room2_deny_replies_are_idempotent(
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -953,7 +946,7 @@ async def test_runtime_listener_duplicate_room2_deny_replies_are_idempotent(
     assert "resultado: erro" in second_feedback
     assert "codigo_erro: state_conflict" in second_feedback
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -976,11 +969,12 @@ async def test_runtime_listener_duplicate_room2_deny_replies_are_idempotent(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_rejects_reply_with_typed_doctor_identity_field(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_typed_identity.db")
     case_id, root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-typed-identity",
     )
     body = (
@@ -1005,7 +999,7 @@ async def test_runtime_listener_rejects_reply_with_typed_doctor_identity_field(
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -1040,7 +1034,7 @@ async def test_runtime_listener_rejects_reply_with_typed_doctor_identity_field(
     assert f"caso: {case_id}" in error_body
     assert sync_client.send_calls == []
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -1063,11 +1057,12 @@ async def test_runtime_listener_rejects_reply_with_typed_doctor_identity_field(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_rejects_reply_from_room2_unauthorized_sender(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_unauthorized.db")
     case_id, root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-unauthorized",
     )
     body = (
@@ -1092,7 +1087,7 @@ async def test_runtime_listener_rejects_reply_from_room2_unauthorized_sender(
         joined_members={"!room2:example.org": {"@doctor:example.org"}},
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -1127,7 +1122,7 @@ async def test_runtime_listener_rejects_reply_from_room2_unauthorized_sender(
     assert f"caso: {case_id}" in error_body
     assert sync_client.send_calls == []
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -1150,11 +1145,11 @@ async def test_runtime_listener_rejects_reply_from_room2_unauthorized_sender(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_emits_error_feedback_when_case_not_waiting_doctor(
-    tmp_path: Path,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_wrong_state.db")
     case_id, root_event_id = await _setup_case_with_status(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-wrong-state",
         status=CaseStatus.DOCTOR_ACCEPTED,
     )
@@ -1179,7 +1174,7 @@ async def test_runtime_listener_emits_error_feedback_when_case_not_waiting_docto
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -1216,11 +1211,12 @@ async def test_runtime_listener_emits_error_feedback_when_case_not_waiting_docto
 
 @pytest.mark.asyncio
 async def test_runtime_listener_ignores_room2_message_without_reply_relation(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_non_reply.db")
     case_id, _root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-non-reply",
     )
     body = (
@@ -1243,7 +1239,7 @@ async def test_runtime_listener_ignores_room2_message_without_reply_relation(
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -1274,7 +1270,7 @@ async def test_runtime_listener_ignores_room2_message_without_reply_relation(
     assert sync_client.reply_calls == []
     assert sync_client.send_calls == []
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -1292,11 +1288,12 @@ async def test_runtime_listener_ignores_room2_message_without_reply_relation(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_ignores_reply_target_not_mapped_to_active_root(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_unmapped_target.db")
     case_id, _root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-unmapped-target",
     )
     body = (
@@ -1320,7 +1317,7 @@ async def test_runtime_listener_ignores_reply_target_not_mapped_to_active_root(
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -1351,7 +1348,7 @@ async def test_runtime_listener_ignores_reply_target_not_mapped_to_active_root(
     assert sync_client.reply_calls == []
     assert sync_client.send_calls == []
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
@@ -1369,11 +1366,12 @@ async def test_runtime_listener_ignores_reply_target_not_mapped_to_active_root(
 
 @pytest.mark.asyncio
 async def test_runtime_listener_ignores_room2_reply_authored_by_bot_user(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room2_reply_listener_bot_sender.db")
     case_id, root_event_id = await _setup_wait_doctor_case(
-        async_url,
+        session_factory_for(async_db_url),
         origin_event_id="$origin-room2-listener-bot-sender",
     )
     body = (
@@ -1397,7 +1395,7 @@ async def test_runtime_listener_ignores_room2_reply_authored_by_bot_user(
         )
     )
 
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     decision_service = HandleDoctorDecisionService(
         case_repository=SqlAlchemyCaseRepository(session_factory),
@@ -1428,7 +1426,7 @@ async def test_runtime_listener_ignores_room2_reply_authored_by_bot_user(
     assert sync_client.reply_calls == []
     assert sync_client.send_calls == []
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         case_row = connection.execute(
             sa.text(
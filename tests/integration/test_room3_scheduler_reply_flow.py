@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from apps.bot_matrix.main import poll_room3_reply_events_once
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.ports.message_repository_port import (
@@ -57,18 +54,6 @@ class FakeMatrixPoster:
         return f"$reprompt-{self._counter}"
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 async def _setup_wait_appt_case(async_url: str, *, origin_event_id: str) -> tuple[UUID, str]:
     session_factory = create_session_factory(async_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
@@ -155,11 +140,13 @@ def _room3_reply_event(
 
 
 @pytest.mark.asyncio
-async def test_non_reply_or_wrong_target_is_ignored(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room3_ignore.db")
-    case_id, _ = await _setup_wait_appt_case(async_url, origin_event_id="$origin-room3-1")
+async def test_non_reply_or_wrong_target_is_ignored(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    case_id, _ = await _setup_wait_appt_case(async_db_url, origin_event_id="$origin-room3-1")
     matrix_poster = FakeMatrixPoster()
-    service = _build_service(async_url, matrix_poster)
+    service = _build_service(async_db_url, matrix_poster)
 
     result = await service.handle_reply(
         Room3ReplyEvent(
@@ -175,7 +162,7 @@ async def test_non_reply_or_wrong_target_is_ignored(tmp_path: Path) -> None:
     assert result.reason == "not_reply"
     assert matrix_poster.reply_calls == []
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         status = connection.execute(
             sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
@@ -185,14 +172,16 @@ async def test_non_reply_or_wrong_target_is_ignored(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_case_mismatch_is_audited_and_no_next_job_enqueued(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room3_case_mismatch.db")
+async def test_case_mismatch_is_audited_and_no_next_job_enqueued(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     case_id, request_event_id = await _setup_wait_appt_case(
-        async_url,
+        async_db_url,
         origin_event_id="$origin-room3-2",
     )
     matrix_poster = FakeMatrixPoster()
-    service = _build_service(async_url, matrix_poster)
+    service = _build_service(async_db_url, matrix_poster)
 
     result = await service.handle_reply(
         Room3ReplyEvent(
@@ -207,7 +196,7 @@ async def test_case_mismatch_is_audited_and_no_next_job_enqueued(tmp_path: Path)
     assert result.processed is False
     assert result.reason == "invalid_template"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         status = connection.execute(
             sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
@@ -231,14 +220,16 @@ async def test_case_mismatch_is_audited_and_no_next_job_enqueued(tmp_path: Path)
 
 
 @pytest.mark.asyncio
-async def test_invalid_format_reprompts_and_keeps_wait_appt(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room3_invalid_format.db")
+async def test_invalid_format_reprompts_and_keeps_wait_appt(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     case_id, request_event_id = await _setup_wait_appt_case(
-        async_url,
+        async_db_url,
         origin_event_id="$origin-room3-3",
     )
     matrix_poster = FakeMatrixPoster()
-    service = _build_service(async_url, matrix_poster)
+    service = _build_service(async_db_url, matrix_poster)
 
     result = await service.handle_reply(
         Room3ReplyEvent(
@@ -259,7 +250,7 @@ async def test_invalid_format_reprompts_and_keeps_wait_appt(tmp_path: Path) -> N
     assert "paciente: não detectado" in reprompt_body
     assert f"caso: {case_id}" in reprompt_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         status = connection.execute(
             sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
@@ -278,14 +269,16 @@ async def test_invalid_format_reprompts_and_keeps_wait_appt(tmp_path: Path) -> N
 
 
 @pytest.mark.asyncio
-async def test_confirmed_template_enqueues_final_appointment_job(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room3_confirmed.db")
+async def test_confirmed_template_enqueues_final_appointment_job(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     case_id, request_event_id = await _setup_wait_appt_case(
-        async_url,
+        async_db_url,
         origin_event_id="$origin-room3-4",
     )
     matrix_poster = FakeMatrixPoster()
-    service = _build_service(async_url, matrix_poster)
+    service = _build_service(async_db_url, matrix_poster)
 
     body = (
         "Confirmed:\n"
@@ -313,7 +306,7 @@ async def test_confirmed_template_enqueues_final_appointment_job(tmp_path: Path)
     assert "no. ocorrência: não detectado" in ack_body
     assert "paciente: não detectado" in ack_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         status = connection.execute(
             sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
@@ -380,14 +373,16 @@ async def test_confirmed_template_enqueues_final_appointment_job(tmp_path: Path)
 
 
 @pytest.mark.asyncio
-async def test_status_template_reply_to_room3_template_message_is_accepted(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room3_status_template_reply.db")
+async def test_status_template_reply_to_room3_template_message_is_accepted(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     case_id, _request_event_id = await _setup_wait_appt_case(
-        async_url,
+        async_db_url,
         origin_event_id="$origin-room3-status-template",
     )
     template_event_id = "$room3-template"
-    session_factory = create_session_factory(async_url)
+    session_factory = create_session_factory(async_db_url)
     message_repository = SqlAlchemyMessageRepository(session_factory)
     await message_repository.add_message(
         CaseMessageCreateInput(
@@ -399,7 +394,7 @@ async def test_status_template_reply_to_room3_template_message_is_accepted(tmp_p
         )
     )
     matrix_poster = FakeMatrixPoster()
-    service = _build_service(async_url, matrix_poster)
+    service = _build_service(async_db_url, matrix_poster)
 
     body = (
         "status: confirmado\n"
@@ -427,7 +422,7 @@ async def test_status_template_reply_to_room3_template_message_is_accepted(tmp_p
     assert "no. ocorrência: não detectado" in ack_body
     assert "paciente: não detectado" in ack_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         status = connection.execute(
             sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
@@ -454,14 +449,16 @@ async def test_status_template_reply_to_room3_template_message_is_accepted(tmp_p
 
 
 @pytest.mark.asyncio
-async def test_runtime_listener_routes_valid_room3_reply_to_service(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room3_listener_valid.db")
+async def test_runtime_listener_routes_valid_room3_reply_to_service(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     case_id, request_event_id = await _setup_wait_appt_case(
-        async_url,
+        async_db_url,
         origin_event_id="$origin-room3-listener-valid",
     )
     matrix_poster = FakeMatrixPoster()
-    service = _build_service(async_url, matrix_poster)
+    service = _build_service(async_db_url, matrix_poster)
 
     body = (
         "Confirmed:\n"
@@ -503,7 +500,7 @@ async def test_runtime_listener_routes_valid_room3_reply_to_service(tmp_path: Pa
     assert "no. ocorrência: não detectado" in ack_body
     assert "paciente: não detectado" in ack_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         status = connection.execute(
             sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
@@ -531,15 +528,15 @@ async def test_runtime_listener_routes_valid_room3_reply_to_service(tmp_path: Pa
 
 @pytest.mark.asyncio
 async def test_runtime_listener_invalid_template_reprompts_and_keeps_wait_appt(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "room3_listener_invalid.db")
     case_id, request_event_id = await _setup_wait_appt_case(
-        async_url,
+        async_db_url,
         origin_event_id="$origin-room3-listener-invalid",
     )
     matrix_poster = FakeMatrixPoster()
-    service = _build_service(async_url, matrix_poster)
+    service = _build_service(async_db_url, matrix_poster)
 
     sync_client = _FakeSyncClient(
         _sync_payload(
@@ -574,7 +571,7 @@ async def test_runtime_listener_invalid_template_reprompts_and_keeps_wait_appt(
     assert "paciente: não detectado" in reprompt_body
     assert f"caso: {case_id}" in reprompt_body
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         status = connection.execute(
             sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
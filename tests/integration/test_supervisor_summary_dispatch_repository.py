@@ -1,39 +1,27 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import UTC, datetime
-from pathlib import Path
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from alembic import command
 from triage_automation.application.ports.supervisor_summary_dispatch_repository_port import (
     SupervisorSummaryDispatchSentInput,
     SupervisorSummaryWindowKey,
 )
-from triage_automation.infrastructure.db.session import create_session_factory
 from triage_automation.infrastructure.db.supervisor_summary_dispatch_repository import (
     SqlAlchemySupervisorSummaryDispatchRepository,
 )
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 @pytest.mark.asyncio
-async def test_claim_window_is_idempotent_for_existing_room_window(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "summary_dispatch_claim.db")
-    session_factory = create_session_factory(async_url)
+async def test_claim_window_is_idempotent_for_existing_room_window(
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
     repository = SqlAlchemySupervisorSummaryDispatchRepository(session_factory)
 
     key = SupervisorSummaryWindowKey(
@@ -57,9 +45,11 @@ async def test_claim_window_is_idempotent_for_existing_room_window(tmp_path: Pat
 
 
 @pytest.mark.asyncio
-async def test_mark_sent_is_compare_and_set_for_pending_window(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "summary_dispatch_mark_sent.db")
-    session_factory = create_session_factory(async_url)
+async def test_mark_sent_is_compare_and_set_for_pending_window(
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
     repository = SqlAlchemySupervisorSummaryDispatchRepository(session_factory)
 
     key = SupervisorSummaryWindowKey(
@@ -101,9 +91,13 @@ async def test_mark_sent_is_compare_and_set_for_pending_window(tmp_path: Path) -
 
 
 @pytest.mark.asyncio
-async def test_claim_window_reclaims_failed_dispatch_by_cas_update(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "summary_dispatch_reclaim_failed.db")
-    session_factory = create_session_factory(async_url)
+async def test_claim_window_reclaims_failed_dispatch_by_cas_update(
+    sync_db_url: str,
+    async_db_url: str,
+    sync_engine_for: Callable[[str], sa.Engine],
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
     repository = SqlAlchemySupervisorSummaryDispatchRepository(session_factory)
 
     key = SupervisorSummaryWindowKey(
@@ -113,7 +107,7 @@ async def test_claim_window_reclaims_failed_dispatch_by_cas_update(tmp_path: Pat
     )
     await repository.claim_window(key)
 
-    engine = sa.create_engine(sync_url)
+    engine = sync_engine_for(sync_db_url)
     with engine.begin() as connection:
         connection.execute(
             sa.text(
@@ -1,28 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import UTC, datetime
-from pathlib import Path
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from apps.scheduler.main import run_scheduler_once
 from triage_automation.config.settings import Settings
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> str:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url
-
-
 def _runtime_settings(*, database_url: str) -> Settings:
     return Settings.model_construct(
         room1_id="!room1:example.org",
@@ -51,15 +38,17 @@ def _runtime_settings(*, database_url: str) -> Settings:
 
 
 @pytest.mark.asyncio
-async def test_manual_scheduler_rerun_for_same_window_is_idempotent(tmp_path: Path) -> None:
-    sync_url = _upgrade_head(tmp_path, "supervisor_summary_scheduler_runtime.db")
-    settings = _runtime_settings(database_url=sync_url.replace("pysqlite", "aiosqlite"))
+async def test_manual_scheduler_rerun_for_same_window_is_idempotent(
+    sync_db_url: str,
+    sync_engine_for: Callable[[str], sa.Engine],
+) -> None:
+    settings = _runtime_settings(database_url=sync_db_url.replace("pysqlite", "aiosqlite"))
     run_at_utc = datetime(2026, 2, 16, 22, 0, tzinfo=UTC)
 
     first = await run_scheduler_once(settings=settings, run_at_utc=run_at_utc)
     second = await run_scheduler_once(settings=settings, run_at_utc=run_at_utc)
 
-    engine = sa.create_engine(sync_url)
+    engine = sync_engine_for(sync_db_url)
     with engine.begin() as connection:
         queued_jobs = connection.execute(
             sa.text("SELECT COUNT(*) FROM jobs WHERE job_type = 'post_room4_summary'"),
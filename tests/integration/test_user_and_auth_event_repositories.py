@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Callable, Iterable, Mapping
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
-from uuid import UUID, uuid4
+from typing import Any
+from uuid import UUID
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from alembic import command
 from triage_automation.application.ports.auth_event_repository_port import (
     AuthEventCreateInput,
 )
@@ -20,45 +21,35 @@ from triage_automation.domain.auth.account_status import AccountStatus
 from triage_automation.domain.auth.roles import Role
 from triage_automation.infrastructure.db.auth_event_repository import SqlAlchemyAuthEventRepository
 from triage_automation.infrastructure.db.auth_token_repository import SqlAlchemyAuthTokenRepository
-from triage_automation.infrastructure.db.session import create_session_factory
 from triage_automation.infrastructure.db.user_repository import SqlAlchemyUserRepository
 
-
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
+_INSERT_USER_SQL = sa.text(
+    "INSERT INTO users (id, email, password_hash, role, is_active, account_status) "
+    "VALUES (:id, :email, :password_hash, :role, :is_active, :account_status)"
+)
+_REVOKE_TOKEN_SQL = sa.text(
+    "UPDATE auth_tokens SET revoked_at = CURRENT_TIMESTAMP WHERE id = :id"
+)
+_SELECT_AUTH_EVENT_SQL = sa.text(
+    "SELECT event_type, ip_address, user_agent, payload FROM auth_events WHERE id = :id"
+)
 
 
-def _insert_user(
-    connection: sa.Connection,
-    *,
-    user_id: UUID,
-    email: str,
-    role: str,
-    is_active: bool,
-    account_status: str | None = None,
-) -> None:
-    resolved_account_status = account_status or ("active" if is_active else "blocked")
-    connection.execute(
-        sa.text(
-            "INSERT INTO users (id, email, password_hash, role, is_active, account_status) "
-            "VALUES (:id, :email, :password_hash, :role, :is_active, :account_status)"
-        ),
-        {
-            "id": user_id.hex,
-            "email": email,
-            "password_hash": "hash",
-            "role": role,
-            "is_active": is_active,
-            "account_status": resolved_account_status,
-        },
+async def _insert_users(session: AsyncSession, rows: Iterable[Mapping[str, Any]]) -> None:
+    await session.execute(
+        _INSERT_USER_SQL,
+        [
+            {
+                "id": row["user_id"].hex,
+                "email": row["email"],
+                "password_hash": "hash",
+                "role": row["role"],
+                "is_active": row["is_active"],
+                "account_status": row.get("account_status")
+                or ("active" if row["is_active"] else "blocked"),
+            }
+            for row in rows
+        ],
     )
 
 
@@ -67,28 +58,32 @@ def test_role_enum_values_are_exact_admin_and_reader() -> None:
 
 
 @pytest.mark.asyncio
-async def test_user_repository_fetches_only_active_user_by_email(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_repo_active.db")
-    session_factory = create_session_factory(async_url)
+async def test_user_repository_fetches_only_active_user_by_email(
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
     repo = SqlAlchemyUserRepository(session_factory)
 
-    engine = sa.create_engine(sync_url)
-    active_id = uuid4()
-    inactive_id = uuid4()
-    with engine.begin() as connection:
-        _insert_user(
-            connection,
-            user_id=active_id,
-            email="admin@example.org",
-            role="admin",
-            is_active=True,
-        )
-        _insert_user(
-            connection,
-            user_id=inactive_id,
-            email="reader@example.org",
-            role="reader",
-            is_active=False,
+    active_id = UUID("11111111-1111-1111-1111-111111111111")
+    inactive_id = UUID("22222222-2222-2222-2222-222222222222")
+    async with session_factory.begin() as session:
+        await _insert_users(
+            session,
+            [
+                {
+                    "user_id": active_id,
+                    "email": "admin@example.org",
+                    "role": "admin",
+                    "is_active": True,
+                },
+                {
+                    "user_id": inactive_id,
+                    "email": "reader@example.org",
+                    "role": "reader",
+                    "is_active": False,
+                },
+            ],
         )
 
     active_user = await repo.get_active_by_email(email="admin@example.org")
@@ -102,21 +97,26 @@ async def test_user_repository_fetches_only_active_user_by_email(tmp_path: Path)
 
 
 @pytest.mark.asyncio
-async def test_auth_event_repository_appends_events(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "auth_event_repo.db")
-    session_factory = create_session_factory(async_url)
+async def test_auth_event_repository_appends_events(
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
     user_repo = SqlAlchemyUserRepository(session_factory)
     auth_event_repo = SqlAlchemyAuthEventRepository(session_factory)
 
-    engine = sa.create_engine(sync_url)
-    user_id = uuid4()
-    with engine.begin() as connection:
-        _insert_user(
-            connection,
-            user_id=user_id,
-            email="reader@example.org",
-            role="reader",
-            is_active=True,
+    user_id = UUID("11111111-1111-1111-1111-111111111111")
+    async with session_factory.begin() as session:
+        await _insert_users(
+            session,
+            [
+                {
+                    "user_id": user_id,
+                    "email": "reader@example.org",
+                    "role": "reader",
+                    "is_active": True,
+                },
+            ],
         )
 
     inserted = await auth_event_repo.append_event(
@@ -134,36 +134,40 @@ async def test_auth_event_repository_appends_events(tmp_path: Path) -> None:
     assert fetched is not None
     assert fetched.user_id == user_id
 
-    with engine.begin() as connection:
-        row = connection.execute(
-            sa.text(
-                "SELECT event_type, ip_address, user_agent, payload "
-                "FROM auth_events WHERE id = :id"
-            ),
+    async with session_factory.begin() as session:
+        result = await session.execute(
+            _SELECT_AUTH_EVENT_SQL,
             {"id": inserted},
-        ).mappings().one()
+        )
+        row = result.mappings().one()
 
     assert row["event_type"] == "LOGIN_SUCCESS"
     assert row["ip_address"] == "127.0.0.1"
     assert row["user_agent"] == "pytest"
-    assert "integration-test" in str(row["payload"])
+    payload = row["payload"] if isinstance(row["payload"], dict) else json.loads(row["payload"])
+    assert payload == {"source": "integration-test"}
 
 
 @pytest.mark.asyncio
-async def test_auth_token_repository_persists_and_resolves_active_tokens(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "auth_token_repo.db")
-    session_factory = create_session_factory(async_url)
+async def test_auth_token_repository_persists_and_resolves_active_tokens(
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
     token_repo = SqlAlchemyAuthTokenRepository(session_factory)
 
-    engine = sa.create_engine(sync_url)
-    user_id = uuid4()
-    with engine.begin() as connection:
-        _insert_user(
-            connection,
-            user_id=user_id,
-            email="admin@example.org",
-            role="admin",
-            is_active=True,
+    user_id = UUID("11111111-1111-1111-1111-111111111111")
+    async with session_factory.begin() as session:
+        await _insert_users(
+            session,
+            [
+                {
+                    "user_id": user_id,
+                    "email": "admin@example.org",
+                    "role": "admin",
+                    "is_active": True,
+                },
+            ],
         )
 
     expires_at = datetime.now(tz=UTC) + timedelta(hours=1)
@@ -180,9 +184,9 @@ async def test_auth_token_repository_persists_and_resolves_active_tokens(tmp_pat
     assert active is not None
     assert active.user_id == user_id
 
-    with engine.begin() as connection:
-        connection.execute(
-            sa.text("UPDATE auth_tokens SET revoked_at = CURRENT_TIMESTAMP WHERE id = :id"),
+    async with session_factory.begin() as session:
+        await session.execute(
+            _REVOKE_TOKEN_SQL,
             {"id": token.id},
         )
 
@@ -191,28 +195,32 @@ async def test_auth_token_repository_persists_and_resolves_active_tokens(tmp_pat
 
 
 @pytest.mark.asyncio
-async def test_auth_token_repository_revokes_active_tokens_for_user(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "auth_token_revoke_by_user.db")
-    session_factory = create_session_factory(async_url)
+async def test_auth_token_repository_revokes_active_tokens_for_user(
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
     token_repo = SqlAlchemyAuthTokenRepository(session_factory)
 
-    engine = sa.create_engine(sync_url)
-    target_user_id = uuid4()
-    other_user_id = uuid4()
-    with engine.begin() as connection:
-        _insert_user(
-            connection,
-            user_id=target_user_id,
-            email="target@example.org",
-            role="reader",
-            is_active=True,
-        )
-        _insert_user(
-            connection,
-            user_id=other_user_id,
-            email="other@example.org",
-            role="admin",
-            is_active=True,
+    target_user_id = UUID("11111111-1111-1111-1111-111111111111")
+    other_user_id = UUID("22222222-2222-2222-2222-222222222222")
+    async with session_factory.begin() as session:
+        await _insert_users(
+            session,
+            [
+                {
+                    "user_id": target_user_id,
+                    "email": "target@example.org",
+                    "role": "reader",
+                    "is_active": True,
+                },
+                {
+                    "user_id": other_user_id,
+                    "email": "other@example.org",
+                    "role": "admin",
+                    "is_active": True,
+                },
+            ],
         )
 
     expires_at = datetime.now(tz=UTC) + timedelta(hours=1)
@@ -237,9 +245,9 @@ async def test_auth_token_repository_revokes_active_tokens_for_user(tmp_path: Pa
             expires_at=expires_at,
         )
     )
-    with engine.begin() as connection:
-        connection.execute(
-            sa.text("UPDATE auth_tokens SET revoked_at = CURRENT_TIMESTAMP WHERE id = :id"),
+    async with session_factory.begin() as session:
+        await session.execute(
+            _REVOKE_TOKEN_SQL,
             {"id": target_token_2.id},
         )
 
@@ -252,28 +260,32 @@ async def test_auth_token_repository_revokes_active_tokens_for_user(tmp_path: Pa
 
 
 @pytest.mark.asyncio
-async def test_user_repository_lists_users_with_account_status(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_repo_list.db")
-    session_factory = create_session_factory(async_url)
+async def test_user_repository_lists_users_with_account_status(
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
     repo = SqlAlchemyUserRepository(session_factory)
 
-    engine = sa.create_engine(sync_url)
-    with engine.begin() as connection:
-        _insert_user(
-            connection,
-            user_id=uuid4(),
-            email="removed@example.org",
-            role="reader",
-            is_active=False,
-            account_status="removed",
-        )
-        _insert_user(
-            connection,
-            user_id=uuid4(),
-            email="active@example.org",
-            role="admin",
-            is_active=True,
-            account_status="active",
+    async with session_factory.begin() as session:
+        await _insert_users(
+            session,
+            [
+                {
+                    "user_id": UUID("11111111-1111-1111-1111-111111111111"),
+                    "email": "removed@example.org",
+                    "role": "reader",
+                    "is_active": False,
+                    "account_status": "removed",
+                },
+                {
+                    "user_id": UUID("22222222-2222-2222-2222-222222222222"),
+                    "email": "active@example.org",
+                    "role": "admin",
+                    "is_active": True,
+                    "account_status": "active",
+                },
+            ],
         )
 
     users = await repo.list_users()
@@ -285,14 +297,16 @@ async def test_user_repository_lists_users_with_account_status(tmp_path: Path) -
 
 
 @pytest.mark.asyncio
-async def test_user_repository_creates_user_and_applies_status_transitions(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_repo_create_update.db")
-    session_factory = create_session_factory(async_url)
+async def test_user_repository_creates_user_and_applies_status_transitions(
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
     repo = SqlAlchemyUserRepository(session_factory)
 
     created = await repo.create_user(
         UserCreateInput(
-            user_id=uuid4(),
+            user_id=UUID("11111111-1111-1111-1111-111111111111"),
             email="new-admin@example.org",
             password_hash="hashed-password",
             role=Role.ADMIN,
@@ -328,20 +342,16 @@ async def test_user_repository_creates_user_and_applies_status_transitions(tmp_p
     assert reactivated.account_status is AccountStatus.ACTIVE
     assert reactivated.is_active is True
 
-    engine = sa.create_engine(sync_url)
-    with engine.connect() as connection:
-        row = (
-            connection.execute(
-                sa.text(
-                    "SELECT email, role, is_active, account_status "
-                    "FROM users "
-                    "WHERE id = :id"
-                ),
-                {"id": created.user_id.hex},
-            )
-            .mappings()
-            .one()
+    async with session_factory() as session:
+        result = await session.execute(
+            sa.text(
+                "SELECT email, role, is_active, account_status "
+                "FROM users "
+                "WHERE id = :id"
+            ),
+            {"id": created.user_id.hex},
         )
+        row = result.mappings().one()
     assert row["email"] == "new-admin@example.org"
     assert row["role"] == "admin"
     assert bool(row["is_active"]) is True
@@ -349,14 +359,16 @@ async def test_user_repository_creates_user_and_applies_status_transitions(tmp_p
 
 
 @pytest.mark.asyncio
-async def test_user_repository_create_blocked_user_sets_is_active_false(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_repo_create_blocked.db")
-    session_factory = create_session_factory(async_url)
+async def test_user_repository_create_blocked_user_sets_is_active_false(
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
+) -> None:
+    session_factory = session_factory_for(async_db_url)
     repo = SqlAlchemyUserRepository(session_factory)
 
     created = await repo.create_user(
         UserCreateInput(
-            user_id=uuid4(),
+            user_id=UUID("11111111-1111-1111-1111-111111111111"),
             email="blocked-user@example.org",
             password_hash="hashed-password",
             role=Role.READER,
@@ -366,32 +378,26 @@ async def test_user_repository_create_blocked_user_sets_is_active_false(tmp_path
     assert created.account_status is AccountStatus.BLOCKED
     assert created.is_active is False
 
-    engine = sa.create_engine(sync_url)
-    with engine.connect() as connection:
-        row = (
-            connection.execute(
-                sa.text(
-                    "SELECT is_active, account_status FROM users WHERE id = :id"
-                ),
-                {"id": created.user_id.hex},
-            )
-            .mappings()
-            .one()
+    async with session_factory() as session:
+        result = await session.execute(
+            sa.text("SELECT is_active, account_status FROM users WHERE id = :id"),
+            {"id": created.user_id.hex},
         )
+        row = result.mappings().one()
     assert bool(row["is_active"]) is False
     assert row["account_status"] == "blocked"
 
 
 @pytest.mark.asyncio
 async def test_user_repository_set_account_status_returns_none_for_unknown_user(
-    tmp_path: Path,
+    async_db_url: str,
+    session_factory_for: Callable[[str], async_sessionmaker[AsyncSession]],
 ) -> None:
-    _, async_url = _upgrade_head(tmp_path, "user_repo_set_status_missing.db")
-    session_factory = create_session_factory(async_url)
+    session_factory = session_factory_for(async_db_url)
     repo = SqlAlchemyUserRepository(session_factory)
 
     updated = await repo.set_account_status(
-        user_id=uuid4(),
+        user_id=UUID("99999999-9999-9999-9999-999999999999"),
         account_status=AccountStatus.BLOCKED,
     )
 
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 from fastapi.testclient import TestClient
 
-from alembic import command
 from apps.bot_api.main import create_app
 from triage_automation.application.services.auth_service import AuthService
 from triage_automation.infrastructure.db.auth_event_repository import SqlAlchemyAuthEventRepository
@@ -20,17 +17,6 @@ from triage_automation.infrastructure.security.password_hasher import BcryptPass
 from triage_automation.infrastructure.security.token_service import OpaqueTokenService
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-    return sync_url, async_url
-
-
 def _insert_user(
     connection: sa.Connection,
     *,
@@ -94,13 +80,15 @@ def _build_client(async_url: str, *, token_service: OpaqueTokenService) -> TestC
 
 
 @pytest.mark.asyncio
-async def test_admin_get_users_page_renders_html(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_management_admin_get_page.db")
+async def test_admin_get_users_page_renders_html(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-users-page-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -110,7 +98,7 @@ async def test_admin_get_users_page_renders_html(tmp_path: Path) -> None:
             token=admin_token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/admin/users",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -122,13 +110,15 @@ async def test_admin_get_users_page_renders_html(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_admin_create_user_form_persists_new_account(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_management_admin_create_form.db")
+async def test_admin_create_user_form_persists_new_account(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-users-create-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -138,7 +128,7 @@ async def test_admin_create_user_form_persists_new_account(tmp_path: Path) -> No
             token=admin_token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/admin/users",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -153,7 +143,7 @@ async def test_admin_create_user_form_persists_new_account(tmp_path: Path) -> No
     assert response.status_code == 303
     assert response.headers["location"].startswith("/admin/users")
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         created = connection.execute(
             sa.text(
                 "SELECT email, role, is_active, account_status "
@@ -177,13 +167,15 @@ async def test_admin_create_user_form_persists_new_account(tmp_path: Path) -> No
 
 
 @pytest.mark.asyncio
-async def test_admin_create_user_form_shows_success_feedback_banner(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_management_admin_feedback_success.db")
+async def test_admin_create_user_form_shows_success_feedback_banner(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     admin_token = "admin-users-success-feedback-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_token(
@@ -193,7 +185,7 @@ async def test_admin_create_user_form_shows_success_feedback_banner(tmp_path: Pa
             token=admin_token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/admin/users",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -212,15 +204,15 @@ async def test_admin_create_user_form_shows_success_feedback_banner(tmp_path: Pa
 
 @pytest.mark.asyncio
 async def test_admin_create_user_form_duplicate_email_shows_error_feedback(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_management_admin_feedback_duplicate.db")
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     existing_id = uuid4()
     admin_token = "admin-users-duplicate-feedback-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_user(
@@ -236,7 +228,7 @@ async def test_admin_create_user_form_duplicate_email_shows_error_feedback(
             token=admin_token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/admin/users",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -251,7 +243,7 @@ async def test_admin_create_user_form_duplicate_email_shows_error_feedback(
     assert "Email ja cadastrado." in response.text
     assert "alert alert-danger" in response.text
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         count = connection.execute(
             sa.text(
                 "SELECT COUNT(*) FROM users WHERE lower(email) = lower(:email)"
@@ -262,14 +254,16 @@ async def test_admin_create_user_form_duplicate_email_shows_error_feedback(
 
 
 @pytest.mark.asyncio
-async def test_admin_user_actions_block_activate_remove_target(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_management_admin_lifecycle_actions.db")
+async def test_admin_user_actions_block_activate_remove_target(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     admin_id = uuid4()
     target_id = uuid4()
     admin_token = "admin-users-lifecycle-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=admin_id, email="admin@example.org", role="admin")
         _insert_user(connection, user_id=target_id, email="reader@example.org", role="reader")
@@ -280,7 +274,7 @@ async def test_admin_user_actions_block_activate_remove_target(tmp_path: Path) -
             token=admin_token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         block_response = client.post(
             f"/admin/users/{target_id}/block",
             headers={"Authorization": f"Bearer {admin_token}"},
@@ -301,7 +295,7 @@ async def test_admin_user_actions_block_activate_remove_target(tmp_path: Path) -
     assert activate_response.status_code == 303
     assert remove_response.status_code == 303
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         target = connection.execute(
             sa.text(
                 "SELECT is_active, account_status FROM users WHERE id = :id LIMIT 1"
@@ -322,13 +316,15 @@ async def test_admin_user_actions_block_activate_remove_target(tmp_path: Path) -
 
 
 @pytest.mark.asyncio
-async def test_reader_get_users_page_is_forbidden_with_403(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_management_reader_get_forbidden.db")
+async def test_reader_get_users_page_is_forbidden_with_403(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     reader_token = "reader-users-page-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_token(
@@ -338,7 +334,7 @@ async def test_reader_get_users_page_is_forbidden_with_403(tmp_path: Path) -> No
             token=reader_token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.get(
             "/admin/users",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -350,15 +346,15 @@ async def test_reader_get_users_page_is_forbidden_with_403(tmp_path: Path) -> No
 
 @pytest.mark.asyncio
 async def test_reader_user_admin_actions_are_forbidden_and_do_not_mutate_state(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "user_management_reader_actions_forbidden.db")
     token_service = OpaqueTokenService()
     reader_id = uuid4()
     target_id = uuid4()
     reader_token = "reader-users-actions-token"
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
         _insert_user(
@@ -374,7 +370,7 @@ async def test_reader_user_admin_actions_are_forbidden_and_do_not_mutate_state(
             token=reader_token,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         create_response = client.post(
             "/admin/users",
             headers={"Authorization": f"Bearer {reader_token}"},
@@ -406,7 +402,7 @@ async def test_reader_user_admin_actions_are_forbidden_and_do_not_mutate_state(
         assert response.status_code == 403
         assert response.json() == {"detail": "admin role required"}
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         user_count = connection.execute(sa.text("SELECT COUNT(*) FROM users")).scalar_one()
         target_row = connection.execute(
             sa.text(
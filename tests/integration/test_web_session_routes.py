@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 from fastapi.testclient import TestClient
 
-from alembic import command
 from apps.bot_api.main import create_app
 from triage_automation.application.services.auth_service import AuthService
 from triage_automation.infrastructure.db.auth_event_repository import SqlAlchemyAuthEventRepository
@@ -20,17 +17,6 @@ from triage_automation.infrastructure.security.password_hasher import BcryptPass
 from triage_automation.infrastructure.security.token_service import OpaqueTokenService
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-    return sync_url, async_url
-
-
 def _insert_user(
     connection: sa.Connection,
     *,
@@ -72,14 +58,14 @@ def _build_client(async_url: str, *, token_service: OpaqueTokenService) -> TestC
 
 @pytest.mark.asyncio
 async def test_root_redirects_to_login_for_anonymous_and_to_dashboard_when_session_exists(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "web_session_root_redirects.db")
     hasher = BcryptPasswordHasher()
     token_service = OpaqueTokenService(token_factory=lambda: "web-session-token")
     admin_id = uuid4()
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         _insert_user(
             connection,
             user_id=admin_id,
@@ -87,7 +73,7 @@ async def test_root_redirects_to_login_for_anonymous_and_to_dashboard_when_sessi
             password_hash=hasher.hash_password("correct-password"),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         anonymous_root = client.get("/", follow_redirects=False)
         login_page = client.get("/login")
         login_response = client.post(
@@ -112,11 +98,12 @@ async def test_root_redirects_to_login_for_anonymous_and_to_dashboard_when_sessi
 
 
 @pytest.mark.asyncio
-async def test_login_rejects_invalid_credentials_without_session_cookie(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "web_session_invalid_credentials.db")
+async def test_login_rejects_invalid_credentials_without_session_cookie(
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         response = client.post(
             "/login",
             data={"email": "missing@example.org", "password": "wrong"},
@@ -129,13 +116,15 @@ async def test_login_rejects_invalid_credentials_without_session_cookie(tmp_path
 
 
 @pytest.mark.asyncio
-async def test_logout_clears_cookie_and_redirects_to_login(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "web_session_logout.db")
+async def test_logout_clears_cookie_and_redirects_to_login(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
     hasher = BcryptPasswordHasher()
     token_service = OpaqueTokenService(token_factory=lambda: "logout-session-token")
     admin_id = uuid4()
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         _insert_user(
             connection,
             user_id=admin_id,
@@ -143,7 +132,7 @@ async def test_logout_clears_cookie_and_redirects_to_login(tmp_path: Path) -> No
             password_hash=hasher.hash_password("correct-password"),
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         client.post(
             "/login",
             data={"email": "admin@example.org", "password": "correct-password"},
@@ -168,19 +157,19 @@ async def test_logout_clears_cookie_and_redirects_to_login(tmp_path: Path) -> No
     ],
 )
 async def test_session_role_matrix_dashboard_allowed_and_prompt_admin_restricted(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
     role: str,
     expected_prompt_status: int,
     expected_users_status: int,
     expected_user_create_status: int,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, f"web_session_role_matrix_{role}.db")
     hasher = BcryptPasswordHasher()
     token_service = OpaqueTokenService(token_factory=lambda: f"{role}-session-token")
     user_id = uuid4()
     email = f"{role}@example.org"
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         _insert_user(
             connection,
             user_id=user_id,
@@ -189,7 +178,7 @@ async def test_session_role_matrix_dashboard_allowed_and_prompt_admin_restricted
             role=role,
         )
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         login_response = client.post(
             "/login",
             data={"email": email, "password": "correct-password"},
@@ -225,7 +214,7 @@ async def test_session_role_matrix_dashboard_allowed_and_prompt_admin_restricted
         assert users_page_response.json() == {"detail": "admin role required"}
         assert create_user_response.json() == {"detail": "admin role required"}
 
-    with sa.create_engine(sync_url).begin() as connection:
+    with sa.create_engine(sync_db_url).begin() as connection:
         total_users = connection.execute(sa.text("SELECT COUNT(*) FROM users")).scalar_one()
 
     if role == "admin":
@@ -235,12 +224,13 @@ async def test_session_role_matrix_dashboard_allowed_and_prompt_admin_restricted
 
 
 @pytest.mark.asyncio
-async def test_anonymous_access_to_user_admin_routes_redirects_to_login(tmp_path: Path) -> None:
-    _, async_url = _upgrade_head(tmp_path, "web_session_user_admin_anonymous_redirect.db")
+async def test_anonymous_access_to_user_admin_routes_redirects_to_login(
+    async_db_url: str,
+) -> None:
     token_service = OpaqueTokenService()
     target_user_id = uuid4()
 
-    with _build_client(async_url, token_service=token_service) as client:
+    with _build_client(async_db_url, token_service=token_service) as client:
         users_page_response = client.get("/admin/users", follow_redirects=False)
         create_response = client.post(
             "/admin/users",
@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from apps.worker.main import run_worker_startup
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.domain.case_status import CaseStatus
@@ -16,18 +13,6 @@ from triage_automation.infrastructure.db.session import create_session_factory
 from triage_automation.infrastructure.db.worker_bootstrap import reconcile_running_jobs
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _insert_job(connection: sa.Connection, *, status: str, attempts: int) -> int:
     job_id = connection.execute(
         sa.text(
@@ -43,16 +28,17 @@ def _insert_job(connection: sa.Connection, *, status: str, attempts: int) -> int
 
 
 @pytest.mark.asyncio
-async def test_reconcile_resets_running_to_queued_with_same_attempts(tmp_path: Path) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "reconcile.db")
-
-    engine = sa.create_engine(sync_url)
+async def test_reconcile_resets_running_to_queued_with_same_attempts(
+    sync_db_url: str,
+    async_db_url: str,
+) -> None:
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         running_zero = _insert_job(connection, status="running", attempts=0)
         running_two = _insert_job(connection, status="running", attempts=2)
         done_job = _insert_job(connection, status="done", attempts=3)
 
-    session_factory = create_session_factory(async_url)
+    session_factory = create_session_factory(async_db_url)
     updated_count = await reconcile_running_jobs(session_factory)
 
     assert updated_count == 2
@@ -78,15 +64,14 @@ async def test_reconcile_resets_running_to_queued_with_same_attempts(tmp_path: P
 
 @pytest.mark.asyncio
 async def test_worker_startup_reconciles_running_jobs_before_recovery_scan(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "worker_startup_reconcile_then_recover.db")
-
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         running_job_id = _insert_job(connection, status="running", attempts=2)
 
-    session_factory = create_session_factory(async_url)
+    session_factory = create_session_factory(async_db_url)
     case_repo = SqlAlchemyCaseRepository(session_factory)
     doctor_accepted_case = await case_repo.create_case(
         CaseCreateInput(
@@ -3,14 +3,11 @@ from __future__ import annotations
 import json
 import re
 from datetime import UTC, datetime
-from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 import sqlalchemy as sa
-from alembic.config import Config
 
-from alembic import command
 from apps.worker.main import build_worker_runtime
 from triage_automation.application.ports.case_repository_port import CaseCreateInput
 from triage_automation.application.ports.job_queue_port import JobEnqueueInput
@@ -23,18 +20,6 @@ from triage_automation.infrastructure.db.message_repository import SqlAlchemyMes
 from triage_automation.infrastructure.db.session import create_session_factory
 
 
-def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
-    db_path = tmp_path / filename
-    sync_url = f"sqlite+pysqlite:///{db_path}"
-    async_url = f"sqlite+aiosqlite:///{db_path}"
-
-    alembic_config = Config("alembic.ini")
-    alembic_config.set_main_option("sqlalchemy.url", sync_url)
-    command.upgrade(alembic_config, "head")
-
-    return sync_url, async_url
-
-
 def _set_required_env(monkeypatch: pytest.MonkeyPatch) -> Settings:
     monkeypatch.setenv("ROOM1_ID", "!room1:example.org")
     monkeypatch.setenv("ROOM2_ID", "!room2:example.org")
@@ -250,12 +235,12 @@ async def _create_case(
 
 @pytest.mark.asyncio
 async def test_runtime_worker_handlers_execute_all_supported_job_types(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "worker_runtime_wiring_all_jobs.db")
     settings = _set_required_env(monkeypatch)
-    session_factory = create_session_factory(async_url)
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     queue_repo = SqlAlchemyJobQueueRepository(session_factory)
@@ -323,7 +308,7 @@ async def test_runtime_worker_handlers_execute_all_supported_job_types(
         ),
     )
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         connection.execute(
             sa.text(
@@ -465,12 +450,12 @@ async def test_runtime_worker_handlers_execute_all_supported_job_types(
 
 @pytest.mark.asyncio
 async def test_runtime_worker_wiring_preserves_success_and_retry_transitions(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "worker_runtime_wiring_transitions.db")
     settings = _set_required_env(monkeypatch)
-    session_factory = create_session_factory(async_url)
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     queue_repo = SqlAlchemyJobQueueRepository(session_factory)
@@ -487,7 +472,7 @@ async def test_runtime_worker_wiring_preserves_success_and_retry_transitions(
         origin_event_id="$origin-retry",
     )
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         connection.execute(
             sa.text(
@@ -543,12 +528,12 @@ async def test_runtime_worker_wiring_preserves_success_and_retry_transitions(
 
 @pytest.mark.asyncio
 async def test_runtime_worker_deterministic_mode_processes_llm_path_without_injected_clients(
-    tmp_path: Path,
+    sync_db_url: str,
+    async_db_url: str,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sync_url, async_url = _upgrade_head(tmp_path, "worker_runtime_deterministic_llm.db")
     settings = _set_required_env(monkeypatch)
-    session_factory = create_session_factory(async_url)
+    session_factory = create_session_factory(async_db_url)
 
     case_repo = SqlAlchemyCaseRepository(session_factory)
     queue_repo = SqlAlchemyJobQueueRepository(session_factory)
@@ -576,7 +561,7 @@ async def test_runtime_worker_deterministic_mode_processes_llm_path_without_inje
 
     assert claimed_count == 1
 
-    engine = sa.create_engine(sync_url)
+    engine = sa.create_engine(sync_db_url)
     with engine.begin() as connection:
         process_row = connection.execute(
             sa.text("SELECT status, attempts, last_error FROM jobs WHERE job_id = :job_id"),
@@ -17,7 +17,10 @@ from triage_automation.infrastructure.http.auth_guard import (
     WidgetAuthGuard,
     extract_bearer_token,
 )
-from triage_automation.infrastructure.security.token_service import OpaqueTokenService
+from triage_automation.infrastructure.security.token_service import (
+    TOKEN_HASH_PREFIX,
+    OpaqueTokenService,
+)
 
 
 @dataclass
@@ -155,6 +158,68 @@ async def test_widget_auth_guard_accepts_valid_admin_token() -> None:
     assert authenticated_user.role is Role.ADMIN
 
 
+@pytest.mark.asyncio
+async def test_widget_auth_guard_accepts_token_persisted_with_legacy_hash() -> None:
+    token_service = OpaqueTokenService()
+    admin = _user(role=Role.ADMIN)
+    admin_token = "legacy-admin-token"
+    legacy_hash = token_service.hash_token_legacy(admin_token)
+    token_record = _token_record(user=admin)
+
+    guard = WidgetAuthGuard(
+        token_service=token_service,
+        auth_token_repository=FakeAuthTokenRepository(
+            records_by_hash={
+                legacy_hash: AuthTokenRecord(
+                    id=token_record.id,
+                    user_id=token_record.user_id,
+                    token_hash=legacy_hash,
+                    issued_at=token_record.issued_at,
+                    expires_at=token_record.expires_at,
+                    revoked_at=token_record.revoked_at,
+                    last_used_at=token_record.last_used_at,
+                )
+            }
+        ),
+        user_repository=FakeUserRepository(users_by_id={admin.user_id: admin}),
+    )
+
+    authenticated_user = await guard.require_admin_user(
+        authorization_header=f"Bearer {admin_token}"
+    )
+
+    assert authenticated_user.user_id == admin.user_id
+
+
+def test_opaque_token_service_hash_is_prefixed_blake2b_digest() -> None:
+    token_service = OpaqueTokenService()
+
+    token_hash = token_service.hash_token("opaque-token")
+
+    assert token_hash.startswith(TOKEN_HASH_PREFIX)
+    assert len(token_hash) == len(TOKEN_HASH_PREFIX) + 64
+    assert token_hash != token_service.hash_token_legacy("opaque-token")
+    assert token_hash == token_service.hash_token("opaque-token")
+
+
+def test_opaque_token_service_hash_bytes_matches_hex_hash() -> None:
+    token_service = OpaqueTokenService()
+
+    digest = token_service.hash_token_bytes("opaque-token")
+
+    assert len(digest) == 32
+    assert token_service.hash_token("opaque-token") == f"{TOKEN_HASH_PREFIX}{digest.hex()}"
+
+
+def test_opaque_token_service_accepts_pre_encoded_token_bytes() -> None:
+    token_service = OpaqueTokenService()
+
+    assert token_service.hash_token(b"opaque-token") == token_service.hash_token("opaque-token")
+    assert token_service.hash_token_legacy(b"opaque-token") == token_service.hash_token_legacy(
+        "opaque-token"
+    )
+
+
 @pytest.mark.asyncio
 async def test_widget_auth_guard_accepts_valid_reader_for_audit_access() -> None:
     token_service = OpaqueTokenService()
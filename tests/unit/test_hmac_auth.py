@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
+
 from triage_automation.infrastructure.http.hmac_auth import (
     compute_hmac_sha256,
     verify_hmac_signature,
@@ -20,3 +23,12 @@ def test_invalid_signature_is_rejected() -> None:
 
     assert not verify_hmac_signature(secret=secret, body=body, provided_signature="bad")
     assert not verify_hmac_signature(secret=secret, body=body, provided_signature=None)
+
+
+def test_compute_hmac_sha256_matches_stdlib_hmac_object_digest() -> None:
+    secret = "super-secret"
+    body = b'{"case_id":"123"}'
+
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+    assert compute_hmac_sha256(secret=secret, body=body) == expected
@@ -26,6 +26,12 @@ def test_decode_llm_json_object_accepts_embedded_json() -> None:
     assert decoded == {"a": 1, "b": 2}
 
 
+def test_decode_llm_json_object_skips_invalid_braces_before_embedded_json() -> None:
+    decoded = decode_llm_json_object('Note {not json} then {"a": {"b": 2}} end')
+
+    assert decoded == {"a": {"b": 2}}
+
+
 def test_decode_llm_json_object_raises_for_non_json_payload() -> None:
     with pytest.raises(LlmJsonParseError):
         decode_llm_json_object("not-json")
@@ -22,7 +22,6 @@ def test_imports_do_not_require_runtime_env_vars(monkeypatch) -> None:
     ):
         monkeypatch.delenv(env_var, raising=False)
 
-    importlib.invalidate_caches()
     assert importlib.import_module("triage_automation") is not None
     assert importlib.import_module("apps.bot_api") is not None
 
@@ -69,3 +69,11 @@ def test_no_supported_pattern_falls_back_to_epoch_millis(
 
     assert result.agency_record_number == "1735689600123"
     assert result.cleaned_text == "no registration anchor here 40371 40371"
+
+
+def test_selected_token_is_not_removed_from_longer_numbers() -> None:
+    text = "RELATÓRIO DE OCORRÊNCIAS 4775652 prontuário 47756521"
+
+    result = extract_and_strip_agency_record_number(text)
+
+    assert result.cleaned_text == "RELATÓRIO DE OCORRÊNCIAS prontuário 47756521"
@@ -102,6 +102,17 @@ def test_build_room2_case_pdf_attachment_filename_uses_fallback_when_record_miss
     )
 
 
+def test_build_room2_case_pdf_attachment_filename_slugifies_record_separators() -> None:
+    case_id = UUID("11111111-1111-1111-1111-111111111111")
+
+    filename = build_room2_case_pdf_attachment_filename(
+        case_id=case_id,
+        agency_record_number=" AB/12__34 -- ",
+    )
+
+    assert filename.startswith("ocorrencia-ab-12-34-caso-")
+
+
 def test_build_room2_case_summary_message_avoids_full_flattened_dump() -> None:
     case_id = UUID("22222222-2222-2222-2222-222222222222")
 
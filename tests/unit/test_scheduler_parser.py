@@ -207,3 +207,16 @@ def test_status_template_accepts_full_width_colon_and_slash_date() -> None:
     assert parsed.case_id == case_id
     assert parsed.location == "Sala 3"
     assert parsed.instructions == "Jejum 8h"
+
+
+def test_confirmed_template_with_mixed_date_separators_raises_error() -> None:
+    case_id = uuid4()
+    body = (
+        "16-02/2026 14:30 BRT\n"
+        "location: Sala 2\n"
+        "instructions: Jejum 8h\n"
+        f"case: {case_id}\n"
+    )
+
+    with pytest.raises(SchedulerParseError, match="invalid_confirmed_datetime"):
+        parse_scheduler_reply(body=body, expected_case_id=case_id)
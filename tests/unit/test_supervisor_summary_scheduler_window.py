@@ -1,20 +1,20 @@
 from __future__ import annotations
 
-import importlib
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import pytest
 
 from triage_automation.application.ports.job_queue_port import JobRecord
+from triage_automation.application.services.supervisor_summary_scheduler_service import (
+    SupervisorSummarySchedulerService,
+    SupervisorSummaryWindow,
+    resolve_previous_summary_window,
+)
 
 
-def _resolve_previous_summary_window(*, run_at_utc: datetime) -> Any:
-    module = importlib.import_module(
-        "triage_automation.application.services.supervisor_summary_scheduler_service"
-    )
-    resolver = getattr(module, "resolve_previous_summary_window")
-    return resolver(
+def _resolve_previous_summary_window(*, run_at_utc: datetime) -> SupervisorSummaryWindow:
+    return resolve_previous_summary_window(
         run_at_utc=run_at_utc,
         timezone_name="America/Bahia",
         morning_hour=7,
@@ -22,24 +22,30 @@ def _resolve_previous_summary_window(*, run_at_utc: datetime) -> Any:
     )
 
 
-def test_morning_cutoff_resolves_previous_night_window_in_utc() -> None:
-    run_at_utc = datetime(2026, 2, 16, 10, 0, tzinfo=UTC)
-
+@pytest.mark.parametrize(
+    ("run_at_utc", "expected_start_utc", "expected_end_utc"),
+    [
+        (
+            datetime(2026, 2, 16, 10, 0, tzinfo=UTC),
+            datetime(2026, 2, 15, 22, 0, tzinfo=UTC),
+            datetime(2026, 2, 16, 10, 0, tzinfo=UTC),
+        ),
+        (
+            datetime(2026, 2, 16, 22, 0, tzinfo=UTC),
+            datetime(2026, 2, 16, 10, 0, tzinfo=UTC),
+            datetime(2026, 2, 16, 22, 0, tzinfo=UTC),
+        ),
+    ],
+)
+def test_cutoff_resolves_previous_window_in_utc(
+    run_at_utc: datetime,
+    expected_start_utc: datetime,
+    expected_end_utc: datetime,
+) -> None:
     resolved = _resolve_previous_summary_window(run_at_utc=run_at_utc)
 
-    assert resolved.window_start_utc == datetime(2026, 2, 15, 22, 0, tzinfo=UTC)
-    assert resolved.window_end_utc == datetime(2026, 2, 16, 10, 0, tzinfo=UTC)
-    assert resolved.window_start_utc < resolved.window_end_utc
-    assert resolved.window_end_utc - resolved.window_start_utc == timedelta(hours=12)
-
-
-def test_evening_cutoff_resolves_same_day_window_in_utc() -> None:
-    run_at_utc = datetime(2026, 2, 16, 22, 0, tzinfo=UTC)
-
-    resolved = _resolve_previous_summary_window(run_at_utc=run_at_utc)
-
-    assert resolved.window_start_utc == datetime(2026, 2, 16, 10, 0, tzinfo=UTC)
-    assert resolved.window_end_utc == datetime(2026, 2, 16, 22, 0, tzinfo=UTC)
+    assert resolved.window_start_utc == expected_start_utc
+    assert resolved.window_end_utc == expected_end_utc
     assert resolved.window_start_utc < resolved.window_end_utc
     assert resolved.window_end_utc - resolved.window_start_utc == timedelta(hours=12)
 
@@ -84,24 +90,22 @@ class _DispatchSpy:
         return True
 
 
-@pytest.mark.asyncio
-async def test_scheduler_service_enqueues_post_room4_summary_with_canonical_utc_payload() -> None:
-    module = importlib.import_module(
-        "triage_automation.application.services.supervisor_summary_scheduler_service"
-    )
-    service_class = getattr(module, "SupervisorSummarySchedulerService")
-
-    queue = _QueueSpy()
-    dispatches = _DispatchSpy()
-    service = service_class(
+def _build_scheduler_service(*, queue: _QueueSpy) -> SupervisorSummarySchedulerService:
+    return SupervisorSummarySchedulerService(
         job_queue=queue,
-        dispatch_repository=dispatches,
+        dispatch_repository=_DispatchSpy(),
         room4_id="!room4:example.org",
         timezone_name="America/Bahia",
         morning_hour=7,
         evening_hour=19,
     )
 
+
+@pytest.mark.asyncio
+async def test_scheduler_service_enqueues_post_room4_summary_with_canonical_utc_payload() -> None:
+    queue = _QueueSpy()
+    service = _build_scheduler_service(queue=queue)
+
     result = await service.enqueue_previous_window_summary(
         run_at_utc=datetime(2026, 2, 16, 22, 0, tzinfo=UTC)
     )
@@ -122,28 +126,13 @@ async def test_scheduler_service_enqueues_post_room4_summary_with_canonical_utc_
 
 @pytest.mark.asyncio
 async def test_scheduler_service_skips_duplicate_window_for_manual_rerun() -> None:
-    module = importlib.import_module(
-        "triage_automation.application.services.supervisor_summary_scheduler_service"
-    )
-    service_class = getattr(module, "SupervisorSummarySchedulerService")
-
     queue = _QueueSpy()
-    dispatches = _DispatchSpy()
-    service = service_class(
-        job_queue=queue,
-        dispatch_repository=dispatches,
-        room4_id="!room4:example.org",
-        timezone_name="America/Bahia",
-        morning_hour=7,
-        evening_hour=19,
-    )
+    service = _build_scheduler_service(queue=queue)
 
-    first = await service.enqueue_previous_window_summary(
-        run_at_utc=datetime(2026, 2, 16, 22, 0, tzinfo=UTC)
-    )
-    second = await service.enqueue_previous_window_summary(
-        run_at_utc=datetime(2026, 2, 16, 22, 0, tzinfo=UTC)
-    )
+    run_at_utc = datetime(2026, 2, 16, 22, 0, tzinfo=UTC)
+
+    first = await service.enqueue_previous_window_summary(run_at_utc=run_at_utc)
+    second = await service.enqueue_previous_window_summary(run_at_utc=run_at_utc)
 
     assert len(queue.calls) == 1
     assert first.claimed_dispatch is True
@@ -7,7 +7,7 @@ import pytest
 
 from apps.worker.main import build_runtime_llm_clients, build_worker_handlers
 from triage_automation.application.ports.job_queue_port import JobRecord
-from triage_automation.application.services.worker_runtime import WorkerRuntime
+from triage_automation.application.services.worker_runtime import JobHandler, WorkerRuntime
 from triage_automation.config.settings import Settings
 from triage_automation.infrastructure.llm.deterministic_client import (
     DeterministicLlmClient,
@@ -17,16 +17,13 @@ from triage_automation.infrastructure.llm.openai_client import OpenAiChatComplet
 
 class _QueueForUnknownType:
     def __init__(self, job: JobRecord) -> None:
-        self._job: JobRecord | None = job
+        self._pending: list[JobRecord] = [job]
         self.schedule_retry_calls: list[tuple[int, str]] = []
 
     async def claim_due_jobs(self, *, limit: int) -> list[JobRecord]:
         _ = limit
-        if self._job is None:
-            return []
-        job = self._job
-        self._job = None
-        return [job]
+        claimed, self._pending = self._pending, []
+        return claimed
 
     async def enqueue(self, payload: object) -> JobRecord:  # pragma: no cover - not used here
         _ = payload
@@ -77,17 +74,14 @@ class _QueueForUnknownType:
 
 class _QueueForKnownType:
     def __init__(self, job: JobRecord) -> None:
-        self._job: JobRecord | None = job
+        self._pending: list[JobRecord] = [job]
         self.mark_done_calls: list[int] = []
         self.schedule_retry_calls: list[tuple[int, str]] = []
 
     async def claim_due_jobs(self, *, limit: int) -> list[JobRecord]:
         _ = limit
-        if self._job is None:
-            return []
-        job = self._job
-        self._job = None
-        return [job]
+        claimed, self._pending = self._pending, []
+        return claimed
 
     async def enqueue(self, payload: object) -> JobRecord:  # pragma: no cover - not used here
         _ = payload
@@ -166,8 +160,9 @@ async def _failing_handler(_: JobRecord) -> None:
     raise RuntimeError("summary send failed")
 
 
-def test_build_worker_handlers_contains_required_runtime_job_types() -> None:
-    handlers = build_worker_handlers(
+@pytest.fixture(scope="module")
+def noop_worker_handlers() -> dict[str, JobHandler]:
+    return build_worker_handlers(
         process_pdf_case_handler=_noop_handler,
         post_room2_widget_handler=_noop_handler,
         post_room3_request_handler=_noop_handler,
@@ -176,7 +171,11 @@ def test_build_worker_handlers_contains_required_runtime_job_types() -> None:
         execute_cleanup_handler=_noop_handler,
     )
 
-    assert set(handlers) == {
+
+def test_build_worker_handlers_contains_required_runtime_job_types(
+    noop_worker_handlers: dict[str, JobHandler],
+) -> None:
+    assert set(noop_worker_handlers) == {
         "process_pdf_case",
         "post_room2_widget",
         "post_room3_request",
@@ -190,17 +189,11 @@ def test_build_worker_handlers_contains_required_runtime_job_types() -> None:
 
 
 @pytest.mark.asyncio
-async def test_unknown_job_type_behavior_remains_unchanged() -> None:
+async def test_unknown_job_type_behavior_remains_unchanged(
+    noop_worker_handlers: dict[str, JobHandler],
+) -> None:
     queue = _QueueForUnknownType(_make_job(job_type="unknown-type", job_id=42))
-    handlers = build_worker_handlers(
-        process_pdf_case_handler=_noop_handler,
-        post_room2_widget_handler=_noop_handler,
-        post_room3_request_handler=_noop_handler,
-        post_room4_summary_handler=_noop_handler,
-        post_room1_final_handler=_noop_handler,
-        execute_cleanup_handler=_noop_handler,
-    )
-    runtime = WorkerRuntime(queue=queue, handlers=handlers)
+    runtime = WorkerRuntime(queue=queue, handlers=noop_worker_handlers)
 
     claimed_count = await runtime.run_once()
 
@@ -211,17 +204,11 @@ async def test_unknown_job_type_behavior_remains_unchanged() -> None:
 
 
 @pytest.mark.asyncio
-async def test_post_room4_summary_job_type_is_routable() -> None:
+async def test_post_room4_summary_job_type_is_routable(
+    noop_worker_handlers: dict[str, JobHandler],
+) -> None:
     queue = _QueueForKnownType(_make_job(job_type="post_room4_summary", job_id=77))
-    handlers = build_worker_handlers(
-        process_pdf_case_handler=_noop_handler,
-        post_room2_widget_handler=_noop_handler,
-        post_room3_request_handler=_noop_handler,
-        post_room4_summary_handler=_noop_handler,
-        post_room1_final_handler=_noop_handler,
-        execute_cleanup_handler=_noop_handler,
-    )
-    runtime = WorkerRuntime(queue=queue, handlers=handlers)
+    runtime = WorkerRuntime(queue=queue, handlers=noop_worker_handlers)
 
     claimed_count = await runtime.run_once()
 